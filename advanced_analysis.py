@@ -1,26 +1,104 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, confusion_matrix
 from sklearn.decomposition import PCA
-import networkx as nx
 from itertools import combinations
 from collections import defaultdict
 import warnings
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the NumPy code paths are used instead
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        return lambda func: func
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
-# Set up visualization style
-plt.style.use('ggplot')
-plt.rcParams['figure.figsize'] = (14, 8)
-plt.rcParams['font.size'] = 12
-sns.set_palette("husl")
+# Columns consumed by PokemonAdvancedAnalysis and the dtypes they are loaded with
+ANALYSIS_DTYPES = {
+    'name': 'category',
+    'primary_type': 'category',
+    'secondary_type': 'category',
+    'hp': 'int16',
+    'attack': 'int16',
+    'defense': 'int16',
+    'special-attack': 'int16',
+    'special-defense': 'int16',
+    'speed': 'int16',
+    'total_stats': 'int32',
+}
+
+# Base stat columns used for clustering and type prediction
+STATS_COLS = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
+
+# Partner types recommended for a seed's primary type (simplified - in practice,
+# you'd derive these from a complete type chart)
+PARTNER_TYPES = {
+    'water': ['electric', 'grass'],
+    # Add more type-based recommendations...
+}
+
+def save_table(df, stem):
+    """Save ``df`` as ``<stem>.parquet`` (zstd), or ``<stem>.csv`` if no Parquet engine is installed."""
+    try:
+        df.to_parquet(f'{stem}.parquet', compression='zstd', index=False)
+    except ImportError:
+        df.to_csv(f'{stem}.csv', index=False)
+
+def with_none_category(series):
+    """Return a categorical copy of ``series`` with missing values filled as 'None'."""
+    series = series.astype('category')
+    if 'None' not in series.cat.categories:
+        series = series.cat.add_categories(['None'])
+    return series.fillna('None')
+
+@njit(cache=True, fastmath=True)
+def _coverage_kernel(chart, team_idx, ntypes):
+    """Count the defending types hit super-effectively by any type in ``team_idx``."""
+    covered = np.zeros(ntypes, np.uint8)
+    for i in range(team_idx.shape[0]):
+        row = chart[team_idx[i]]
+        for j in range(ntypes):
+            if row[j] > 1.0:
+                covered[j] = 1
+    return covered.sum()
+
+@njit(parallel=True, cache=True)
+def _bulk_recommend_kernel(seed_idxs, order, ptype, stype, partners, team_size):
+    """Build one team per seed; rows are positional indices, -1 marks empty slots.
+    
+    ``order`` lists rows by descending total stats, ``ptype``/``stype`` hold type
+    indices (-1 for missing) and ``partners[t]`` the -1-padded partner types of t.
+    """
+    teams = np.full((seed_idxs.shape[0], team_size), -1, np.int32)
+    for s in prange(seed_idxs.shape[0]):
+        seed = seed_idxs[s]
+        teams[s, 0] = seed
+        filled = 1
+        p = ptype[seed]
+        if p < 0:
+            continue
+        for k in range(partners.shape[1]):
+            t = partners[p, k]
+            if t < 0 or filled >= team_size:
+                break
+            for r in range(order.shape[0]):
+                row = order[r]
+                if ptype[row] == t or stype[row] == t:
+                    teams[s, filled] = row
+                    filled += 1
+                    break
+    return teams
 
 class PokemonAdvancedAnalysis:
     """
@@ -31,7 +109,11 @@ class PokemonAdvancedAnalysis:
     
     def __init__(self, data_path='data/pokemon_engineered.csv'):
         """Initialize with the engineered Pokémon dataset."""
-        self.df = pd.read_csv(data_path)
+        self.df = pd.read_csv(
+            data_path,
+            usecols=list(ANALYSIS_DTYPES),
+            dtype=ANALYSIS_DTYPES
+        )
         self.type_colors = {
             'normal': '#A8A77A', 'fire': '#EE8130', 'water': '#6390F0',
             'electric': '#F7D02C', 'grass': '#7AC74C', 'ice': '#96D9D6',
@@ -44,6 +126,26 @@ class PokemonAdvancedAnalysis:
         
         # Type chart for synergy analysis (simplified)
         self.type_chart = self._create_type_chart()
+        
+        # Dense (attacker, defender) multiplier matrix indexed like type_colors
+        self._type_names = list(self.type_colors)
+        self._type_to_idx = {t: i for i, t in enumerate(self._type_names)}
+        self._chart = np.ones((len(self._type_names), len(self._type_names)), dtype=np.float32)
+        for attacker, targets in self.type_chart.items():
+            for defender, multiplier in targets.items():
+                self._chart[self._type_to_idx[attacker], self._type_to_idx[defender]] = multiplier
+        
+        # Standardized stats shared by the clustering methods (see _scaled_stats)
+        self._scaled_stats_cache = None
+        
+        # Row positions ordered by descending total stats (ties keep file order)
+        self._by_total_desc = np.argsort(-self.df['total_stats'].to_numpy(np.int32), kind='stable')
+        
+        # Plotting libraries are imported and styled on first use (see _setup_style)
+        self._styled = False
+        
+        # Random forest kept between predict_types calls for incremental growth
+        self._type_model = None
     
     def _create_type_chart(self):
         """Create a type effectiveness chart."""
@@ -56,16 +158,40 @@ class PokemonAdvancedAnalysis:
         }
         return type_chart
     
+    @property
+    def _scaled_stats(self):
+        """Standardized base stats and total_stats as a float32 frame, computed once."""
+        if self._scaled_stats_cache is None:
+            cols = STATS_COLS + ['total_stats']
+            scaled = StandardScaler().fit_transform(self.df[cols]).astype(np.float32)
+            self._scaled_stats_cache = pd.DataFrame(scaled, columns=cols, index=self.df.index)
+        return self._scaled_stats_cache
+    
+    def _setup_style(self):
+        """Import matplotlib/seaborn and apply the visualization style once."""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        if not self._styled:
+            plt.style.use('ggplot')
+            plt.rcParams['figure.figsize'] = (14, 8)
+            plt.rcParams['font.size'] = 12
+            sns.set_palette("husl")
+            self._styled = True
+        return plt, sns
+    
     # 1. Visualization Methods
     def plot_type_distribution(self):
         """Plot distribution of primary and secondary types."""
+        plt, sns = self._setup_style()
         plt.figure(figsize=(16, 6))
         
         # Primary type distribution
         plt.subplot(1, 2, 1)
         primary_counts = self.df['primary_type'].value_counts()
         primary_colors = [self.type_colors.get(t, '#000000') for t in primary_counts.index]
-        sns.barplot(x=primary_counts.values, y=primary_counts.index, palette=primary_colors)
+        sns.barplot(x=primary_counts.values, y=primary_counts.index,
+                    order=list(primary_counts.index), palette=primary_colors)
         plt.title('Primary Type Distribution')
         plt.xlabel('Count')
         
@@ -73,7 +199,8 @@ class PokemonAdvancedAnalysis:
         plt.subplot(1, 2, 2)
         secondary_counts = self.df['secondary_type'].dropna().value_counts()
         secondary_colors = [self.type_colors.get(t, '#000000') for t in secondary_counts.index]
-        sns.barplot(x=secondary_counts.values, y=secondary_counts.index, palette=secondary_colors)
+        sns.barplot(x=secondary_counts.values, y=secondary_counts.index,
+                    order=list(secondary_counts.index), palette=secondary_colors)
         plt.title('Secondary Type Distribution')
         plt.xlabel('Count')
         
@@ -83,18 +210,27 @@ class PokemonAdvancedAnalysis:
     
     def plot_stat_distribution_by_type(self):
         """Plot distribution of stats grouped by primary type."""
+        plt, sns = self._setup_style()
         stats = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
         
-        plt.figure(figsize=(18, 12))
-        for i, stat in enumerate(stats, 1):
-            plt.subplot(2, 3, i)
-            # Get top 10 most common types for better visualization
-            top_types = self.df['primary_type'].value_counts().index[:10]
-            filtered_df = self.df[self.df['primary_type'].isin(top_types)]
-            sns.boxplot(x='primary_type', y=stat, data=filtered_df, 
-                       palette=self.type_colors)
-            plt.title(f'{stat.title()} by Primary Type')
-            plt.xticks(rotation=45)
+        # Get top 10 most common types for better visualization
+        top_types = list(self.df['primary_type'].value_counts().index[:10])
+        filtered_df = self.df[self.df['primary_type'].isin(top_types)]
+        
+        # Long-form frame so all six panels come from a single catplot call
+        titles = {stat: stat.title() for stat in stats}
+        long_df = filtered_df.rename(columns=titles).melt(
+            id_vars='primary_type', value_vars=list(titles.values()),
+            var_name='stat', value_name='value'
+        )
+        
+        g = sns.catplot(data=long_df, x='primary_type', y='value', col='stat', col_wrap=3,
+                        kind='box', order=top_types, palette=self.type_colors,
+                        sharex=False, sharey=False, height=6, aspect=1)
+        g.set_titles('{col_name} by Primary Type')
+        g.set_axis_labels('primary_type', '')
+        for ax in g.axes.flat:
+            ax.tick_params(axis='x', labelrotation=45)
         
         plt.tight_layout()
         plt.savefig('stat_distribution_by_type.png', dpi=300, bbox_inches='tight')
@@ -102,8 +238,13 @@ class PokemonAdvancedAnalysis:
     
     def plot_correlation_heatmap(self):
         """Plot correlation heatmap of Pokémon stats."""
+        plt, sns = self._setup_style()
         stats = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed', 'total_stats']
-        corr = self.df[stats].corr()
+        # Pearson correlation as a single float32 matmul over standardized columns
+        arr = self.df[stats].to_numpy(dtype=np.float32, copy=True)
+        arr -= arr.mean(axis=0)
+        arr /= arr.std(axis=0, ddof=1)
+        corr = pd.DataFrame((arr.T @ arr) / (arr.shape[0] - 1), index=stats, columns=stats)
         
         plt.figure(figsize=(12, 8))
         mask = np.triu(np.ones_like(corr, dtype=bool))
@@ -117,7 +258,7 @@ class PokemonAdvancedAnalysis:
     def analyze_team_composition(self, team_size=6):
         """Analyze and suggest balanced team compositions."""
         # Get top Pokémon by total stats
-        top_pokemon = self.df.nlargest(100, 'total_stats')
+        top_pokemon = self.df.iloc[self._by_total_desc[:100]]
         
         # Ensure coverage of different types and roles
         team = []
@@ -128,76 +269,88 @@ class PokemonAdvancedAnalysis:
         roles = ['physical_attacker', 'special_attacker', 'physical_wall', 
                 'special_wall', 'hazard_setter', 'hazard_control']
         
-        # Simple role assignment based on stats
-        def assign_role(pokemon):
-            if pokemon['attack'] > pokemon['special-attack'] * 1.5:
-                return 'physical_attacker'
-            elif pokemon['special-attack'] > pokemon['attack'] * 1.5:
-                return 'special_attacker'
-            elif pokemon['defense'] > 100 and pokemon['hp'] > 80:
-                return 'physical_wall'
-            elif pokemon['special-defense'] > 100 and pokemon['hp'] > 80:
-                return 'special_wall'
-            elif pokemon['speed'] > 100:
-                return 'hazard_control'
-            else:
-                return 'hazard_setter'
-        
-        # Sort Pokémon by total stats and try to cover all roles and types
-        for _, pokemon in top_pokemon.iterrows():
+        # Simple role assignment based on stats (conditions are checked in order).
+        # pd.eval runs each expression through numexpr when it is installed.
+        stat_arrays = {
+            'atk': top_pokemon['attack'].to_numpy(np.int32),
+            'spa': top_pokemon['special-attack'].to_numpy(np.int32),
+            'dfn': top_pokemon['defense'].to_numpy(np.int32),
+            'spd': top_pokemon['special-defense'].to_numpy(np.int32),
+            'hp': top_pokemon['hp'].to_numpy(np.int32),
+            'spe': top_pokemon['speed'].to_numpy(np.int32),
+        }
+        role_expressions = [
+            'atk > spa * 1.5',               # physical_attacker
+            'spa > atk * 1.5',               # special_attacker
+            '(dfn > 100) & (hp > 80)',       # physical_wall
+            '(spd > 100) & (hp > 80)',       # special_wall
+            'spe > 100',                     # hazard_control
+        ]
+        conditions = [pd.eval(expr, local_dict=stat_arrays) for expr in role_expressions]
+        role_ids = np.select(conditions, [0, 1, 2, 3, 5], default=4).astype(np.int8)
+        
+        names = top_pokemon['name'].values
+        primary_types = top_pokemon['primary_type'].values
+        secondary_types = top_pokemon['secondary_type'].values
+        
+        # Walk Pokémon in total-stats order and try to cover all roles and types
+        for i, role_id in enumerate(role_ids):
             if len(team) >= team_size:
                 break
                 
-            role = assign_role(pokemon)
+            role = roles[role_id]
             if role not in roles_covered:
-                team.append((pokemon['name'], pokemon['primary_type'], 
-                            pokemon.get('secondary_type', 'None'), role))
-                types_covered.add(pokemon['primary_type'])
-                if pd.notna(pokemon.get('secondary_type')):
-                    types_covered.add(pokemon['secondary_type'])
+                team.append((names[i], primary_types[i], secondary_types[i], role))
+                types_covered.add(primary_types[i])
+                if pd.notna(secondary_types[i]):
+                    types_covered.add(secondary_types[i])
                 roles_covered.add(role)
         
         # Create a DataFrame for the team
         team_df = pd.DataFrame(team, columns=['Name', 'Primary Type', 'Secondary Type', 'Role'])
+        team_df['Secondary Type'] = with_none_category(team_df['Secondary Type'])
         
-        # Save team to CSV
-        team_df.to_csv('suggested_team.csv', index=False)
+        # Save team to disk
+        save_table(team_df, 'suggested_team')
         
         return team_df
     
     # 3. Type Synergy Evaluation
     def evaluate_type_synergy(self, team):
         """Evaluate the type synergy of a given team."""
-        team_types = []
-        for _, row in team.iterrows():
-            team_types.append(row['Primary Type'])
-            if pd.notna(row['Secondary Type']) and row['Secondary Type'] != 'None':
-                team_types.append(row['Secondary Type'])
+        primary = team['Primary Type']
+        secondary = team['Secondary Type']
+        secondary = secondary[secondary.notna() & (secondary != 'None')]
+        team_types = pd.concat([primary, secondary], ignore_index=True).astype(str)
         
         # Count type occurrences
-        type_counts = pd.Series(team_types).value_counts()
+        idx = self._type_indices(team_types)
+        type_counts = np.bincount(idx, minlength=len(self._type_names))
         
         # Check for type redundancy
-        redundant_types = type_counts[type_counts > 1].index.tolist()
+        redundant_types = [self._type_names[i] for i in np.flatnonzero(type_counts > 1)]
         
         return {
-            'type_diversity': len(set(team_types)) / len(team_types) if team_types else 0,
+            'type_diversity': np.count_nonzero(type_counts) / len(idx) if len(idx) else 0,
             'redundant_types': redundant_types,
-            'type_coverage': self._calculate_type_coverage(set(team_types))
+            'type_coverage': self._calculate_type_coverage(team_types)
         }
     
+    def _type_indices(self, types):
+        """Map type names to row indices of the type chart matrix, skipping unknown types."""
+        return np.fromiter(
+            (self._type_to_idx[t] for t in types if t in self._type_to_idx),
+            dtype=np.int8
+        )
+    
     def _calculate_type_coverage(self, types):
         """Calculate how many types the team is strong against."""
-        all_types = set(self.type_colors.keys())
-        covered = set()
-        
-        for t in types:
-            if t in self.type_chart:
-                for target_type, multiplier in self.type_chart[t].items():
-                    if multiplier > 1:  # Super effective
-                        covered.add(target_type)
-        
-        return len(covered) / len(all_types) * 100  # Percentage coverage
+        idx = self._type_indices(set(types))
+        if NUMBA_AVAILABLE:
+            covered = _coverage_kernel(self._chart, idx, len(self._type_names))
+        else:
+            covered = (self._chart[idx] > 1).any(axis=0).sum()
+        return covered / len(self._type_names) * 100  # Percentage coverage
     
     # 4. Competitive Tier Classification
     def classify_competitive_tiers(self, n_clusters=5):
@@ -206,12 +359,12 @@ class PokemonAdvancedAnalysis:
         features = ['total_stats', 'speed', 'attack', 'special-attack', 
                   'defense', 'special-defense', 'hp']
         
-        # Scale the features
-        scaler = StandardScaler()
-        X = scaler.fit_transform(self.df[features])
+        # Scaled features (shared with cluster_similar_pokemon)
+        X = np.ascontiguousarray(self._scaled_stats[features].to_numpy())
         
-        # Apply K-means clustering
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+        # Apply mini-batch K-means clustering
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42,
+                                 batch_size=256, n_init=3, max_iter=100)
         self.df['tier'] = kmeans.fit_predict(X)
         
         # Sort tiers by average total stats (higher = better)
@@ -220,13 +373,17 @@ class PokemonAdvancedAnalysis:
         self.df['tier'] = self.df['tier'].map(tier_mapping)
         
         # Save the tiered data
-        self.df.to_csv('pokemon_with_tiers.csv', index=False)
+        save_table(self.df, 'pokemon_with_tiers')
         
         return self.df[['name', 'primary_type', 'total_stats', 'tier']].sort_values('tier')
     
     # 5. Machine Learning: Type Prediction
-    def predict_types(self):
-        """Predict Pokémon types based on their stats using Random Forest."""
+    def predict_types(self, n_estimators=100, incremental=False):
+        """Predict Pokémon types based on their stats using Random Forest.
+        
+        With ``incremental=True`` the forest from the previous call is grown by
+        ``n_estimators`` more trees (warm start) instead of being refit from scratch.
+        """
         # Prepare data
         features = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
         X = self.df[features]
@@ -237,9 +394,16 @@ class PokemonAdvancedAnalysis:
             X, y, test_size=0.2, random_state=42, stratify=y
         )
         
-        # Train the model
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
+        # Train the model (warm_start lets later calls add trees to the same forest)
+        if incremental and self._type_model is not None:
+            model = self._type_model
+            model.n_estimators += n_estimators
+        else:
+            model = RandomForestClassifier(n_estimators=n_estimators, bootstrap=True,
+                                           max_features='sqrt', warm_start=True,
+                                           random_state=42, n_jobs=-1)
         model.fit(X_train, y_train)
+        self._type_model = model
         
         # Make predictions
         y_pred = model.predict(X_test)
@@ -262,20 +426,17 @@ class PokemonAdvancedAnalysis:
     # 6. Pokémon Clustering
     def cluster_similar_pokemon(self, n_clusters=10):
         """Cluster similar Pokémon based on their stats."""
-        # Select relevant features
-        features = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
-        X = self.df[features]
-        
-        # Scale the features
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+        plt, _ = self._setup_style()
+        # Scaled features (shared with classify_competitive_tiers)
+        X_scaled = np.ascontiguousarray(self._scaled_stats[STATS_COLS].to_numpy())
         
         # Apply PCA for visualization
         pca = PCA(n_components=2)
         X_pca = pca.fit_transform(X_scaled)
         
-        # Apply K-means clustering
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+        # Apply mini-batch K-means clustering
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42,
+                                 batch_size=256, n_init=3, max_iter=100)
         clusters = kmeans.fit_predict(X_scaled)
         
         # Add clusters to the DataFrame
@@ -293,7 +454,7 @@ class PokemonAdvancedAnalysis:
         plt.show()
         
         # Save cluster information
-        self.df[['name', 'primary_type', 'total_stats', 'cluster']].to_csv('pokemon_clusters.csv', index=False)
+        save_table(self.df[['name', 'primary_type', 'total_stats', 'cluster']], 'pokemon_clusters')
         
         return self.df[['name', 'primary_type', 'cluster']].sort_values('cluster')
     
@@ -309,17 +470,15 @@ class PokemonAdvancedAnalysis:
         
         # Add Pokémon that cover the seed's weaknesses
         # This is a simplified version - in practice, you'd use a complete type chart
-        recommended_types = []
-        if seed['primary_type'] == 'water':
-            recommended_types.extend(['electric', 'grass'])
-        # Add more type-based recommendations...
+        recommended_types = PARTNER_TYPES.get(seed['primary_type'], [])
         
-        # Add Pokémon with recommended types
+        # Add Pokémon with recommended types (pool is pre-sorted by total stats)
+        pool = self.df.iloc[self._by_total_desc]
         for t in recommended_types:
-            candidates = self.df[
-                (self.df['primary_type'] == t) | 
-                (self.df['secondary_type'] == t)
-            ].sort_values('total_stats', ascending=False)
+            candidates = pool[
+                pool['primary_type'].isin([t]) | 
+                pool['secondary_type'].isin([t])
+            ].head(1)
             
             if not candidates.empty:
                 team.append(candidates.iloc[0])
@@ -334,8 +493,55 @@ class PokemonAdvancedAnalysis:
             'secondary_type': p.get('secondary_type', 'None'),
             'total_stats': p['total_stats']
         } for p in team])
+        team_df['secondary_type'] = with_none_category(team_df['secondary_type'])
         
         return team_df
+    
+    def recommend_teams(self, pokemon_names, team_size=6):
+        """Recommend a team for each seed Pokémon in one batched pass.
+        
+        Uses the same partner-type rules as recommend_team, but builds all teams
+        in a single (numba-parallel, if available) kernel call.
+        """
+        # Locate the seeds by position
+        positions = pd.Series(np.arange(len(self.df)), index=self.df['name'].str.lower().values)
+        positions = positions[~positions.index.duplicated()]
+        seed_names = [name.lower() for name in pokemon_names]
+        for name, key in zip(pokemon_names, seed_names):
+            if key not in positions.index:
+                raise ValueError(f"Unknown Pokémon: {name!r}")
+        seed_idxs = positions.loc[seed_names].to_numpy(np.int32)
+        
+        # Type indices shared by both type columns, plus the partner table
+        ptype = self._type_index_array(self.df['primary_type'])
+        stype = self._type_index_array(self.df['secondary_type'])
+        width = max((len(v) for v in PARTNER_TYPES.values()), default=0)
+        partners = np.full((len(self._type_names), width), -1, dtype=np.int8)
+        for t, partner_types in PARTNER_TYPES.items():
+            partners[self._type_to_idx[t], :len(partner_types)] = [self._type_to_idx[p] for p in partner_types]
+        order = self._by_total_desc.astype(np.int32)
+        
+        teams = _bulk_recommend_kernel(seed_idxs, order, ptype, stype, partners, team_size)
+        
+        # Wrap the index matrix back into a DataFrame
+        seed_col, member_idx = np.nonzero(teams >= 0)
+        members = self.df.iloc[teams[seed_col, member_idx]]
+        team_df = pd.DataFrame({
+            'seed': self.df['name'].to_numpy()[seed_idxs[seed_col]],
+            'name': members['name'].to_numpy(),
+            'primary_type': members['primary_type'].to_numpy(),
+            'secondary_type': members['secondary_type'].to_numpy(),
+            'total_stats': members['total_stats'].to_numpy()
+        })
+        team_df['secondary_type'] = with_none_category(team_df['secondary_type'])
+        
+        return team_df
+    
+    def _type_index_array(self, column):
+        """Convert a categorical type column to type chart indices (-1 for missing)."""
+        lookup = np.array([self._type_to_idx.get(t, -1) for t in column.cat.categories], dtype=np.int8)
+        codes = column.cat.codes.to_numpy()
+        return np.where(codes >= 0, lookup[codes], -1).astype(np.int8)
 
 def main():
     """Main function to run the advanced analysis."""
@@ -368,9 +574,9 @@ def main():
     print("\n4. Classifying Pokémon into competitive tiers...")
     tiers = analyzer.classify_competitive_tiers()
     print("\n=== Top Pokémon by Tier ===")
-    for tier, group in tiers.groupby('tier').head(3).groupby('tier'):
+    for tier, group in tiers.groupby('tier'):
         print(f"\nTier {tier}:")
-        print(group[['name', 'primary_type', 'total_stats']].to_string(index=False))
+        print(group.head(3)[['name', 'primary_type', 'total_stats']].to_string(index=False))
     
     # 5. Type prediction with machine learning
     print("\n5. Training type prediction model...")
@@ -380,9 +586,9 @@ def main():
     print("\n6. Clustering similar Pokémon...")
     clusters = analyzer.cluster_similar_pokemon()
     print("\n=== Sample Clusters ===")
-    for cluster, group in clusters.groupby('cluster').head(3).groupby('cluster'):
+    for cluster, group in clusters.groupby('cluster'):
         print(f"\nCluster {cluster}:")
-        print(group[['name', 'primary_type']].to_string(index=False))
+        print(group.head(3)[['name', 'primary_type']].to_string(index=False))
     
     # 7. Team recommendation
     print("\n7. Generating team recommendations...")
@@ -10,21 +10,21 @@ A comprehensive battle system for Pokémon battles with support for:
 
 # Import core components
 from .enums import (
-    MoveCategory, Weather, Terrain, 
+    Type, EventKind, MoveCategory, MoveFlags, Weather, Terrain, 
     SideCondition, StatusCondition, VolatileStatus
 )
 from .move import Move
 from .pokemon import Pokemon
 from .ability import Ability, create_ability, get_ability
 from .item import Item, create_item, get_item
-from .battle import Battle, create_sample_battle
+from .battle import Battle, SideState, create_sample_battle
 
 __all__ = [
     # Core classes
-    'Pokemon', 'Move', 'Ability', 'Item', 'Battle',
+    'Pokemon', 'Move', 'Ability', 'Item', 'Battle', 'SideState',
     
     # Enums
-    'MoveCategory', 'Weather', 'Terrain', 
+    'Type', 'EventKind', 'MoveCategory', 'MoveFlags', 'Weather', 'Terrain', 
     'SideCondition', 'StatusCondition', 'VolatileStatus',
     
     # Factory functions
@@ -0,0 +1,22 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled damage formula core.
+
+Same arithmetic as ``_damage_core_py.damage_core``; build it in place with
+``cythonize -i pokemon_battle_system/_damage_core_c.pyx``.
+"""
+
+
+cpdef double damage_core(double level, double power, double attack, double defense, bint stab,
+                         double effectiveness, double crit_mul, double rand_mul):
+    """Numeric core of the damage formula.
+    
+    Returns:
+        float: The calculated damage, at least 1
+    """
+    cdef double damage = ((2 * level / 5 + 2) * power * attack / defense) / 50 + 2
+    if stab:
+        damage *= 1.5
+    damage *= effectiveness
+    damage *= crit_mul
+    damage *= rand_mul
+    return damage if damage > 1 else 1.0
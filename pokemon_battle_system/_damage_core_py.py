@@ -0,0 +1,31 @@
+"""Pure-Python damage formula core, JIT-compiled with Numba when available.
+
+Used when the compiled ``_damage_core_c`` extension has not been built.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; damage_core then runs as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        return lambda func: func
+
+
+@njit(cache=True)
+def damage_core(level: float, power: float, attack: float, defense: float, stab: bool,
+                effectiveness: float, crit_mul: float, rand_mul: float) -> float:
+    """Numeric core of the damage formula.
+    
+    Takes only primitive values so it can be compiled by Numba; random rolls
+    are made by the caller and passed in as multipliers.
+    
+    Returns:
+        float: The calculated damage, at least 1
+    """
+    damage = ((2 * level / 5 + 2) * power * attack / defense) / 50 + 2
+    if stab:
+        damage *= 1.5
+    damage *= effectiveness
+    damage *= crit_mul
+    damage *= rand_mul
+    return damage if damage > 1 else 1.0
@@ -1,8 +1,17 @@
 """Ability class for Pokémon battle system."""
+import sys
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional, Callable, Dict, Any, List
 
-@dataclass
+# Names of the optional callback hooks an ability can define
+_HOOK_NAMES = (
+    'on_start', 'on_switch_in', 'on_damage', 'on_after_move', 'on_before_move',
+    'on_faint', 'on_weather_change', 'on_terrain_change', 'on_status_apply',
+    'on_stat_change'
+)
+
+@dataclass(slots=True)
 class Ability:
     """Represents an ability that a Pokémon can have.
     
@@ -19,6 +28,7 @@ class Ability:
         on_terrain_change (callable, optional): Called when the terrain changes
         on_status_apply (callable, optional): Called when a status is applied
         on_stat_change (callable, optional): Called when a stat changes
+        handlers (Dict[str, Callable]): Hook name -> callback, for the hooks that are set
     """
     name: str
     description: str
@@ -32,6 +42,14 @@ class Ability:
     on_terrain_change: Optional[Callable] = None
     on_status_apply: Optional[Callable] = None
     on_stat_change: Optional[Callable] = None
+    handlers: Dict[str, Callable] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Build the dispatch table of the hooks this ability defines."""
+        self.handlers = {
+            name: getattr(self, name) for name in _HOOK_NAMES
+            if getattr(self, name) is not None
+        }
     
     def __str__(self) -> str:
         """Return a string representation of the ability."""
@@ -44,11 +62,17 @@ def create_ability(name: str, description: str, **kwargs) -> Ability:
     Args:
         name (str): Name of the ability
         description (str): Description of the ability
-        **kwargs: Callback functions for the ability
+        **kwargs: Callback functions for the ability, keyed by hook name
         
     Returns:
         Ability: A new Ability instance
+        
+    Raises:
+        ValueError: If a keyword is not a known hook name
     """
+    unknown = set(kwargs) - set(_HOOK_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown ability hook(s): {', '.join(sorted(unknown))}")
     return Ability(name=name, description=description, **kwargs)
 
 # Example abilities
@@ -61,7 +85,7 @@ INTIMIDATE = create_ability(
 LEVITATE = create_ability(
     name="Levitate",
     description="Gives immunity to Ground-type moves.",
-    on_damage=lambda battle, target, move, damage: 0 if move.type.lower() == 'ground' else damage
+    on_damage=lambda battle, target, move, damage: 0 if move.type_lower == 'ground' else damage
 )
 
 SPEED_BOOST = create_ability(
@@ -70,13 +94,14 @@ SPEED_BOOST = create_ability(
     on_after_move=lambda battle, pokemon: battle.boost_stat(pokemon, 'speed', 1)
 )
 
-# Dictionary of all abilities
-ABILITIES = {
+# Dictionary of all abilities (interned lowercase keys, read-only view)
+_ABILITIES = {sys.intern(key): ability for key, ability in {
     'intimidate': INTIMIDATE,
     'levitate': LEVITATE,
     'speed_boost': SPEED_BOOST,
     # Add more abilities as needed
-}
+}.items()}
+ABILITIES = MappingProxyType(_ABILITIES)
 
 def get_ability(name: str) -> Optional[Ability]:
     """Get an ability by name.
@@ -87,4 +112,4 @@ def get_ability(name: str) -> Optional[Ability]:
     Returns:
         Optional[Ability]: The ability if found, None otherwise
     """
-    return ABILITIES.get(name.lower())
+    return _ABILITIES.get(sys.intern(name.lower()))
@@ -1,17 +1,98 @@
 """Battle class for Pokémon battle system."""
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional, Set, Any, Union
+from typing import List, Dict, Tuple, Optional, Set, Any, Union, Callable, Sequence
 import random
 import time
+from functools import partial
 from colorama import Fore, Style, Back
 
 from .enums import (
-    MoveCategory, Weather, Terrain, SideCondition, StatusCondition, VolatileStatus
+    EventKind, MoveCategory, MoveFlags, Weather, Terrain, SideCondition, StatusCondition, VolatileStatus
 )
 from .pokemon import Pokemon
 from .move import Move
 from .ability import Ability
 from .item import Item
+from .type_chart import type_effectiveness
+
+try:
+    from ._damage_core_c import damage_core as _damage_core
+except ImportError:  # compiled extension not built; use the Python (optionally Numba) version
+    from ._damage_core_py import damage_core as _damage_core
+
+
+# EventKind -> (colored template, plain template) used to render log entries.
+# The ANSI codes are baked in at import time.
+_LOG_TEMPLATES = {
+    EventKind.MESSAGE: ("{}", "{}"),
+    EventKind.SEND_OUT_P1: (f"\n{Fore.BLUE}Team 1 sends out {{}}!{Style.RESET_ALL}", "\nTeam 1 sends out {}!"),
+    EventKind.SEND_OUT_P2: (f"{Fore.RED}Team 2 sends out {{}}!{Style.RESET_ALL}", "Team 2 sends out {}!"),
+    EventKind.TURN_START: (f"\n{Fore.CYAN}=== Turn {{}} ==={Style.RESET_ALL}", "\n=== Turn {} ==="),
+    EventKind.MOVE_USED: (f"{Fore.CYAN}{{}}{Style.RESET_ALL} used {Fore.YELLOW}{{}}{Style.RESET_ALL}!",
+                          "{} used {}!"),
+}
+
+
+def format_log_entry(entry: Tuple, color: bool = True) -> str:
+    """Render one battle log entry as text.
+    
+    Args:
+        entry (Tuple): An (EventKind, *args) entry from Battle.log
+        color (bool): Whether to include ANSI color codes
+        
+    Returns:
+        str: The rendered message
+    """
+    kind, *args = entry
+    return _LOG_TEMPLATES[kind][0 if color else 1].format(*args)
+
+# End-of-turn damage per StatusCondition, indexed by its value: (max HP divisor,
+# message) or None. Toxic damage is further multiplied by the turns it has lasted.
+_STATUS_DAMAGE = (
+    None,                             # NONE
+    (8, "was hurt by poison!"),       # POISON
+    (16, "was hurt by toxic!"),       # TOXIC
+    (8, "was hurt by its burn!"),     # BURN
+    None,                             # FREEZE
+    None,                             # PARALYSIS
+    None,                             # SLEEP
+    None,                             # FAINTED
+)
+
+# Bit assigned to each side condition in SideState.conditions
+_SIDE_CONDITION_BITS = {condition: 1 << i for i, condition in enumerate(SideCondition)}
+
+
+@dataclass(slots=True)
+class SideState:
+    """State of one side of the battlefield.
+    
+    Attributes:
+        conditions (int): Bitmask of the active SideCondition values
+        reflect (int): Turns of Reflect remaining
+        light_screen (int): Turns of Light Screen remaining
+        aurora_veil (int): Turns of Aurora Veil remaining
+    """
+    conditions: int = 0
+    reflect: int = 0
+    light_screen: int = 0
+    aurora_veil: int = 0
+    
+    def add_condition(self, condition: SideCondition) -> None:
+        """Set a side condition."""
+        self.conditions |= _SIDE_CONDITION_BITS[condition]
+    
+    def remove_condition(self, condition: SideCondition) -> None:
+        """Clear a side condition."""
+        self.conditions &= ~_SIDE_CONDITION_BITS[condition]
+    
+    def has_condition(self, condition: SideCondition) -> bool:
+        """Check if a side condition is active."""
+        return bool(self.conditions & _SIDE_CONDITION_BITS[condition])
+
+
+# Move used when a Pokémon has no PP left; its PP is never spent
+_STRUGGLE = Move("Struggle", "Normal", 50, 100, -1, -1, MoveCategory.PHYSICAL)
 
 class Battle:
     """Represents a Pokémon battle between two trainers.
@@ -22,44 +103,83 @@ class Battle:
         weather (Weather): Current weather condition
         terrain (Terrain): Current terrain
         turn (int): Current turn number
-        sides (Dict[str, Dict]): Information about each side of the field
-        log (List[str]): Battle log
+        sides (Tuple[SideState, SideState]): State of team 1's and team 2's side of the field
+        log (List[Tuple]): Battle log as (EventKind, *args) entries; see format_log
+        search_depth (int): Plies searched by the move selection AI
+        silent (bool): Simulation mode; nothing is printed, logged, or waited on
     """
     
-    def __init__(self, team1: List[Pokemon], team2: List[Pokemon]):
+    def __init__(self, team1: List[Pokemon], team2: List[Pokemon], search_depth: int = 2,
+                 rng: Optional[random.Random] = None, silent: bool = False,
+                 pace: Optional[Callable[[float], None]] = None):
         """Initialize a new battle.
         
         Args:
             team1 (List[Pokemon]): First trainer's team
             team2 (List[Pokemon]): Second trainer's team
+            search_depth (int): Plies searched by the move selection AI (at least 1)
+            rng (random.Random, optional): Random number generator for the battle's rolls.
+                Defaults to the global ``random`` module.
+            silent (bool): Run as a headless simulation, skipping all output, the
+                battle log, and the team preview pause
+            pace (callable, optional): Called with a number of seconds wherever the battle
+                pauses for the viewer. Defaults to ``time.sleep``; pass a no-op to run
+                without delays.
+        
+        Raises:
+            ValueError: If search_depth is less than 1
         """
+        if search_depth < 1:
+            raise ValueError(f"search_depth must be at least 1, got {search_depth}")
         self.team1 = team1
         self.team2 = team2
         self.weather = Weather.CLEAR
         self.terrain = Terrain.NONE
         self.turn = 0
-        self.sides = {
-            'p1': {'conditions': set(), 'reflect': 0, 'light_screen': 0, 'aurora_veil': 0},
-            'p2': {'conditions': set(), 'reflect': 0, 'light_screen': 0, 'aurora_veil': 0}
-        }
+        self.sides = (SideState(), SideState())
         self.log = []
+        self.search_depth = search_depth
+        self.silent = silent
+        self._pace = pace if pace is not None else time.sleep
+        # Bound once so every roll is a single call with no module/attribute lookups
+        self._random = (rng or random).random
+        # (move type, defender primary type, defender secondary type) -> multiplier
+        self._effectiveness_cache: Dict[Tuple[int, int, int], float] = {}
         self._init_teams()
     
     def _init_teams(self) -> None:
         """Initialize the teams for battle."""
-        for pokemon in self.team1 + self.team2:
-            # Set up initial HP and stat stages
-            pokemon.current_hp = pokemon.max_hp
-            pokemon.reset_stat_stages()
-            
-            # Reset status conditions (except for fainted Pokémon)
-            if pokemon.status == StatusCondition.FAINTED:
-                pokemon.status = StatusCondition.NONE
+        for team_idx, team in enumerate((self.team1, self.team2)):
+            for pokemon in team:
+                # Detach any earlier battle's hooks before reviving the Pokémon
+                pokemon.on_faint = pokemon.on_revive = None
+                
+                # Set up initial HP and stat stages
+                pokemon.heal(pokemon.max_hp)
+                pokemon.reset_stat_stages()
+                
+                # Reset status conditions (except for fainted Pokémon)
+                if pokemon.status == StatusCondition.FAINTED:
+                    pokemon.status = StatusCondition.NONE
+                
+                # Keep the live counts below in step as Pokémon faint or are revived
+                pokemon.on_faint = partial(self._on_faint, team_idx)
+                pokemon.on_revive = partial(self._on_revive, team_idx)
+        
+        # Number of Pokémon still standing on each team
+        self._alive_count = [len(self.team1), len(self.team2)]
+        
+        # Replacement preference per team, highest base HP first (ties keep team order)
+        self._replacement_order = {
+            id(team): tuple(sorted(team, key=lambda p: p.hp, reverse=True))
+            for team in (self.team1, self.team2)
+        }
     
     def start_battle(self) -> None:
         """Start the battle."""
         self.log_message("The battle has begun!")
-        self._show_team_preview()
+        if not self.silent:
+            self._show_team_preview()
         self._begin_battle()
     
     def _show_team_preview(self) -> None:
@@ -81,7 +201,7 @@ class Battle:
             self.log_message(f"{i}. {pokemon.name} ({types}) - Lv. {pokemon.level}")
         
         self.log_message("\nThe battle will begin shortly...")
-        time.sleep(2)
+        self._pace(2)
     
     def _begin_battle(self) -> None:
         """Begin the main battle loop."""
@@ -89,13 +209,13 @@ class Battle:
         active_p1 = self.team1[0]
         active_p2 = self.team2[0]
         
-        self.log_message(f"\n{Fore.BLUE}Team 1 sends out {active_p1.name}!{Style.RESET_ALL}")
-        self.log_message(f"{Fore.RED}Team 2 sends out {active_p2.name}!{Style.RESET_ALL}")
+        self._log(EventKind.SEND_OUT_P1, active_p1.name)
+        self._log(EventKind.SEND_OUT_P2, active_p2.name)
         
         # Main battle loop
         while not self._is_battle_over():
             self.turn += 1
-            self.log_message(f"\n{Fore.CYAN}=== Turn {self.turn} ==={Style.RESET_ALL}")
+            self._log(EventKind.TURN_START, self.turn)
             
             # Check for weather and terrain effects
             self._handle_weather_effects()
@@ -135,6 +255,9 @@ class Battle:
     def _select_move(self, attacker: Pokemon, defender: Pokemon) -> Move:
         """Select a move for a Pokémon to use.
         
+        Runs a minimax search with alpha-beta pruning over both Pokémon's
+        moves, scoring each line by the remaining HP difference.
+        
         Args:
             attacker (Pokemon): The attacking Pokémon
             defender (Pokemon): The defending Pokémon
@@ -142,34 +265,150 @@ class Battle:
         Returns:
             Move: The selected move
         """
-        # Simple AI: Choose the move with the highest damage output
-        best_move = None
-        max_damage = 0
+        # Damage estimates don't change within the search, so evaluate every
+        # candidate move of both sides once up front
+        attacker_moves = self._ordered_moves(attacker, defender)
+        state = (attacker.current_hp, defender.current_hp,
+                 attacker_moves, self._ordered_moves(defender, attacker))
+        _, best_move = self._alphabeta(state, self.search_depth, float('-inf'), float('inf'), True)
+        
+        # The search stops before choosing if the position is already decided;
+        # take the strongest usable move then
+        if best_move is None:
+            best_move = attacker_moves[0][1]
         
-        for move in attacker.moves:
-            if move.pp <= 0:
-                continue
-                
-            # Calculate expected damage
-            damage = self._calculate_damage(attacker, defender, move)
+        # If no moves left, use Struggle
+        if best_move is None:
+            return _STRUGGLE
+        
+        return best_move
+    
+    def _alphabeta(self, state: Tuple[float, float, List[Tuple[float, Optional[Move]]],
+                                      List[Tuple[float, Optional[Move]]]],
+                   depth: int, alpha: float, beta: float,
+                   maximizing: bool) -> Tuple[float, Optional[Move]]:
+        """Search move choices with minimax and alpha-beta pruning.
+        
+        Args:
+            state (Tuple): (attacker_hp, defender_hp, attacker_moves, defender_moves) being
+                searched, where the move lists come from _ordered_moves
+            depth (int): Remaining plies to search
+            alpha (float): Best score the attacker is already assured of
+            beta (float): Best score the defender is already assured of
+            maximizing (bool): True if the attacker is to move, False for the defender
             
-            # Consider type effectiveness
-            effectiveness = self._calculate_type_effectiveness(move, defender)
-            damage *= effectiveness
+        Returns:
+            Tuple[float, Optional[Move]]: Score of the line and the move leading to it
+                (None if the side to move can only Struggle)
+        """
+        attacker_hp, defender_hp, attacker_moves, defender_moves = state
+        if depth == 0 or attacker_hp <= 0 or defender_hp <= 0:
+            return attacker_hp - defender_hp, None
+        
+        best_move = None
+        if maximizing:
+            value = float('-inf')
+            for damage, move in attacker_moves:
+                child = (attacker_hp, max(0.0, defender_hp - damage), attacker_moves, defender_moves)
+                score, _ = self._alphabeta(child, depth - 1, alpha, beta, False)
+                if score > value:
+                    value, best_move = score, move
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+        else:
+            value = float('inf')
+            for damage, move in defender_moves:
+                child = (max(0.0, attacker_hp - damage), defender_hp, attacker_moves, defender_moves)
+                score, _ = self._alphabeta(child, depth - 1, alpha, beta, True)
+                if score < value:
+                    value, best_move = score, move
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break
+        
+        return value, best_move
+    
+    def _ordered_moves(self, user: Pokemon, target: Pokemon) -> List[Tuple[float, Optional[Move]]]:
+        """List usable moves with their expected damage, strongest first.
+        
+        Trying the strongest moves first lets alpha-beta prune more of the tree.
+        
+        Args:
+            user (Pokemon): The Pokémon choosing a move
+            target (Pokemon): The Pokémon being targeted
             
-            # Consider STAB
-            if move.type.lower() in [t.lower() for t in attacker.get_types()]:
-                damage *= 1.5
+        Returns:
+            List[Tuple[float, Optional[Move]]]: (expected damage, move) pairs, or a single
+                (Struggle damage, None) pair if no move has PP left
+        """
+        usable = [move for move in user.moves if move.pp > 0]
+        if not usable:
+            return [(self._estimate_damage(user, target, _STRUGGLE), None)]
+        candidates = list(zip(self._estimate_damages(user, target, usable), usable))
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        return candidates
+    
+    def _estimate_damage(self, attacker: Pokemon, defender: Pokemon, move: Move) -> float:
+        """Estimate the expected damage of a move without rolling or logging.
+        
+        Uses the mean random factor, no critical hit, and scales by accuracy.
+        
+        Args:
+            attacker (Pokemon): The attacking Pokémon
+            defender (Pokemon): The defending Pokémon
+            move (Move): The move being considered
             
-            if damage > max_damage:
-                max_damage = damage
-                best_move = move
+        Returns:
+            float: The expected damage
+        """
+        return self._estimate_damages(attacker, defender, (move,))[0]
+    
+    def _estimate_damages(self, attacker: Pokemon, defender: Pokemon,
+                          moves: Sequence[Move]) -> List[float]:
+        """Estimate the expected damage of several moves in one pass.
         
-        # If no moves left, use Struggle
-        if not best_move:
-            return Move("Struggle", "Normal", 50, 100, -1, -1, MoveCategory.PHYSICAL)
+        The attacker's and defender's stats are gathered once for the whole
+        batch, so each move only costs a type lookup and a damage_core call.
         
-        return best_move
+        Args:
+            attacker (Pokemon): The attacking Pokémon
+            defender (Pokemon): The defending Pokémon
+            moves (Sequence[Move]): The moves being considered
+            
+        Returns:
+            List[float]: The expected damage of each move, in order
+        """
+        level = attacker.level
+        type_mask = attacker.type_mask
+        physical = (attacker.get_stat('attack'), defender.get_stat('defense'))
+        special = (attacker.get_stat('special_attack'), defender.get_stat('special_defense'))
+        
+        damages = []
+        for move in moves:
+            if move.is_status:
+                damages.append(0.0)
+                continue
+            attack, defense = physical if move.is_physical else special
+            damage = _damage_core(level, move.power, attack, defense, bool(type_mask & move.type_bit),
+                                  self._type_effectiveness(move, defender), 1.0, 0.925)
+            damages.append(damage * move.accuracy / 100)
+        return damages
+    
+    def _attack_and_defense(self, attacker: Pokemon, defender: Pokemon, move: Move) -> Tuple[int, int]:
+        """Get the attacking and defending stats used by a damaging move.
+        
+        Args:
+            attacker (Pokemon): The attacking Pokémon
+            defender (Pokemon): The defending Pokémon
+            move (Move): The move being used
+            
+        Returns:
+            Tuple[int, int]: (attack, defense) stat values
+        """
+        if move.is_physical:
+            return attacker.get_stat('attack'), defender.get_stat('defense')
+        return attacker.get_stat('special_attack'), defender.get_stat('special_defense')
     
     def _calculate_damage(self, attacker: Pokemon, defender: Pokemon, move: Move) -> float:
         """Calculate the damage of a move.
@@ -182,37 +421,27 @@ class Battle:
         Returns:
             float: The calculated damage
         """
-        if move.category == MoveCategory.STATUS:
+        if move.is_status:
             return 0
             
         # Base damage calculation
-        if move.category == MoveCategory.PHYSICAL:
-            attack = attacker.get_stat('attack')
-            defense = defender.get_stat('defense')
-        else:  # Special
-            attack = attacker.get_stat('special_attack')
-            defense = defender.get_stat('special_defense')
-        
-        # Base damage formula
-        damage = ((2 * attacker.level / 5 + 2) * move.power * attack / defense) / 50 + 2
-        
-        # Apply STAB
-        if move.type.lower() in [t.lower() for t in attacker.get_types()]:
-            damage *= 1.5
+        attack, defense = self._attack_and_defense(attacker, defender, move)
         
-        # Apply type effectiveness
+        # STAB and type effectiveness
+        stab = bool(attacker.type_mask & move.type_bit)
         effectiveness = self._calculate_type_effectiveness(move, defender)
-        damage *= effectiveness
         
         # Apply critical hit (4.17% chance, or 12.5% with high crit moves)
-        if random.random() < (0.125 if move.flags.get('high_crit', False) else 0.0417):
-            damage *= 1.5
+        crit_mul = 1.0
+        if self._random() < (0.125 if move.flag_bits & MoveFlags.HIGH_CRIT else 0.0417):
+            crit_mul = 1.5
             self.log_message("A critical hit!")
         
         # Apply random factor (0.85 to 1.0)
-        damage *= random.uniform(0.85, 1.0)
+        rand_mul = 0.85 + 0.15 * self._random()
         
-        return max(1, damage)
+        return _damage_core(attacker.level, move.power, attack, defense, stab,
+                            effectiveness, crit_mul, rand_mul)
     
     def _calculate_type_effectiveness(self, move: Move, defender: Pokemon) -> float:
         """Calculate type effectiveness of a move against a Pokémon.
@@ -224,47 +453,36 @@ class Battle:
         Returns:
             float: Effectiveness multiplier (0, 0.25, 0.5, 1, 2, or 4)
         """
-        # This is a simplified type chart - in a real implementation, you'd want a complete one
-        type_chart = {
-            'normal': {'rock': 0.5, 'ghost': 0, 'steel': 0.5},
-            'fire': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 2, 'bug': 2, 'rock': 0.5, 'dragon': 0.5, 'steel': 2},
-            'water': {'fire': 2, 'water': 0.5, 'grass': 0.5, 'ground': 2, 'rock': 2, 'dragon': 0.5},
-            'electric': {'water': 2, 'electric': 0.5, 'grass': 0.5, 'ground': 0, 'flying': 2, 'dragon': 0.5},
-            'grass': {'fire': 0.5, 'water': 2, 'grass': 0.5, 'poison': 0.5, 'ground': 2, 'flying': 0.5, 'bug': 0.5, 'rock': 2, 'dragon': 0.5, 'steel': 0.5},
-            'ice': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 0.5, 'ground': 2, 'flying': 2, 'dragon': 2, 'steel': 0.5},
-            'fighting': {'normal': 2, 'ice': 2, 'poison': 0.5, 'flying': 0.5, 'psychic': 0.5, 'bug': 0.5, 'rock': 2, 'ghost': 0, 'dark': 2, 'steel': 2, 'fairy': 0.5},
-            'poison': {'grass': 2, 'poison': 0.5, 'ground': 0.5, 'rock': 0.5, 'ghost': 0.5, 'steel': 0, 'fairy': 2},
-            'ground': {'fire': 2, 'electric': 2, 'grass': 0.5, 'poison': 2, 'flying': 0, 'bug': 0.5, 'rock': 2, 'steel': 2},
-            'flying': {'electric': 0.5, 'grass': 2, 'fighting': 2, 'bug': 2, 'rock': 0.5, 'steel': 0.5},
-            'psychic': {'fighting': 2, 'poison': 2, 'psychic': 0.5, 'dark': 0, 'steel': 0.5},
-            'bug': {'fire': 0.5, 'grass': 2, 'fighting': 0.5, 'poison': 0.5, 'flying': 0.5, 'psychic': 2, 'ghost': 0.5, 'dark': 2, 'steel': 0.5, 'fairy': 0.5},
-            'rock': {'fire': 2, 'ice': 2, 'fighting': 0.5, 'ground': 0.5, 'flying': 2, 'bug': 2, 'steel': 0.5},
-            'ghost': {'normal': 0, 'psychic': 2, 'ghost': 2, 'dark': 0.5},
-            'dragon': {'dragon': 2, 'steel': 0.5, 'fairy': 0},
-            'dark': {'fighting': 0.5, 'psychic': 2, 'ghost': 2, 'dark': 0.5, 'fairy': 0.5},
-            'steel': {'fire': 0.5, 'water': 0.5, 'electric': 0.5, 'ice': 2, 'rock': 2, 'steel': 0.5, 'fairy': 2},
-            'fairy': {'fire': 0.5, 'fighting': 2, 'poison': 0.5, 'dragon': 2, 'dark': 2, 'steel': 0.5}
-        }
-        
-        effectiveness = 1.0
-        move_type = move.type.lower()
+        effectiveness = self._type_effectiveness(move, defender)
         
-        # Check against primary type
-        if move_type in type_chart and defender.primary_type.lower() in type_chart[move_type]:
-            effectiveness *= type_chart[move_type][defender.primary_type.lower()]
+        # Log effectiveness
+        if not self.silent:
+            if effectiveness == 0:
+                self.log_message("It doesn't affect " + defender.name + "...")
+            elif effectiveness < 1:
+                self.log_message("It's not very effective...")
+            elif effectiveness > 1:
+                self.log_message("It's super effective!")
         
-        # Check against secondary type
-        if defender.secondary_type and defender.secondary_type.lower() in type_chart.get(move_type, {}):
-            effectiveness *= type_chart[move_type][defender.secondary_type.lower()]
+        return effectiveness
+    
+    def _type_effectiveness(self, move: Move, defender: Pokemon) -> float:
+        """Look up type effectiveness without logging, memoized per battle.
         
-        # Log effectiveness
-        if effectiveness == 0:
-            self.log_message("It doesn't affect " + defender.name + "...")
-        elif effectiveness < 1:
-            self.log_message("It's not very effective...")
-        elif effectiveness > 1:
-            self.log_message("It's super effective!")
+        Types never change mid-battle, so results are cached by
+        (move type, defender primary type, defender secondary type).
         
+        Args:
+            move (Move): The move being used
+            defender (Pokemon): The defending Pokémon
+            
+        Returns:
+            float: Effectiveness multiplier (0, 0.25, 0.5, 1, 2, or 4)
+        """
+        key = (move.type_id, defender.primary_type_id, defender.secondary_type_id)
+        effectiveness = self._effectiveness_cache.get(key)
+        if effectiveness is None:
+            effectiveness = self._effectiveness_cache[key] = type_effectiveness(*key)
         return effectiveness
     
     def _determine_move_order(self, p1: Pokemon, move1: Move, p2: Pokemon, move2: Move) -> Tuple:
@@ -279,33 +497,33 @@ class Battle:
         Returns:
             Tuple: (first_pokemon, first_move, second_pokemon), (second_pokemon, second_move, first_pokemon)
         """
-        # Compare move priorities
-        if move1.priority > move2.priority:
-            return (p1, move1, p2), (p2, move2, p1)
-        elif move2.priority > move1.priority:
-            return (p2, move2, p1), (p1, move1, p2)
+        # Compare by move priority, then speed
+        key1 = self._order_key(p1, move1)
+        key2 = self._order_key(p2, move2)
+        
+        # Randomly decide in case of a full tie
+        p1_first = self._random() < 0.5 if key1 == key2 else key1 > key2
+        
+        first, second = (p1, move1, p2), (p2, move2, p1)
+        return (first, second) if p1_first else (second, first)
+    
+    def _order_key(self, pokemon: Pokemon, move: Move) -> Tuple[int, int]:
+        """Get the sort key that decides turn order; higher moves first.
         
-        # Same priority, compare speed
-        p1_speed = p1.get_stat('speed')
-        p2_speed = p2.get_stat('speed')
+        Args:
+            pokemon (Pokemon): The Pokémon using the move
+            move (Move): The move being used
+            
+        Returns:
+            Tuple[int, int]: (move priority, effective speed)
+        """
+        speed = pokemon.get_stat('speed')
         
         # Apply paralysis speed drop
-        if p1.status == StatusCondition.PARALYSIS:
-            p1_speed = int(p1_speed * 0.5)
-        if p2.status == StatusCondition.PARALYSIS:
-            p2_speed = int(p2_speed * 0.5)
-        
-        # Check for speed ties
-        if p1_speed == p2_speed:
-            # Randomly decide in case of tie
-            if random.random() < 0.5:
-                return (p1, move1, p2), (p2, move2, p1)
-            else:
-                return (p2, move2, p1), (p1, move1, p2)
-        elif p1_speed > p2_speed:
-            return (p1, move1, p2), (p2, move2, p1)
-        else:
-            return (p2, move2, p1), (p1, move1, p2)
+        if pokemon.status == StatusCondition.PARALYSIS:
+            speed >>= 1
+        
+        return move.priority, speed
     
     def _execute_move(self, attacker: Pokemon, move: Move, defender: Pokemon) -> None:
         """Execute a move in battle.
@@ -318,16 +536,16 @@ class Battle:
         if attacker.is_fainted() or defender.is_fainted():
             return
             
-        self.log_message(f"{Fore.CYAN}{attacker.name}{Style.RESET_ALL} used {Fore.YELLOW}{move.name}{Style.RESET_ALL}!")
+        self._log(EventKind.MOVE_USED, attacker.name, move.name)
         
         # Check for accuracy
-        accuracy_check = random.random() * 100
+        accuracy_check = self._random() * 100
         if accuracy_check > move.accuracy:
             self.log_message("But it missed!")
             return
         
         # Handle status moves
-        if move.category == MoveCategory.STATUS:
+        if move.is_status:
             self._handle_status_move(attacker, move, defender)
             return
         
@@ -338,8 +556,9 @@ class Battle:
         defender.take_damage(damage)
         
         # Log damage
-        self.log_message(f"{defender.name} took {damage} damage!")
-        self.log_message(defender.get_hp_bar())
+        if not self.silent:
+            self.log_message(f"{defender.name} took {damage} damage!")
+            self.log_message(defender.get_hp_bar())
         
         # Apply move effects
         if move.effect:
@@ -375,10 +594,12 @@ class Battle:
             return
             
         effect = move.effect
+        chance = move.effect_chance
+        stat = effect.get('stat')
+        status_name = effect.get('status')
         
         # Stat changes
-        if 'stat' in effect and random.random() < effect.get('chance', 1.0):
-            stat = effect['stat']
+        if stat is not None and self._random() < chance:
             stages = effect['stages']
             target.modify_stat_stage(stat, stages)
             
@@ -389,8 +610,8 @@ class Battle:
                 self.log_message(f"{target.name}'s {stat} fell!")
         
         # Status conditions
-        if 'status' in effect and random.random() < effect.get('chance', 1.0):
-            status = StatusCondition(effect['status'])
+        if status_name is not None and self._random() < chance:
+            status = StatusCondition[status_name.upper()]
             self._apply_status_condition(target, status)
     
     def _apply_status_condition(self, target: Pokemon, status: StatusCondition) -> None:
@@ -402,7 +623,7 @@ class Battle:
         """
         if target.status == StatusCondition.NONE:
             target.status = status
-            self.log_message(f"{target.name} was {status.value}ed!")
+            self.log_message(f"{target.name} was {status.name.lower()}ed!")
     
     def _handle_weather_effects(self) -> None:
         """Handle weather effects at the end of the turn."""
@@ -423,28 +644,33 @@ class Battle:
     def _end_of_turn_effects(self, p1: Pokemon, p2: Pokemon) -> None:
         """Handle end of turn effects like status damage and weather."""
         # Handle status conditions
-        for pokemon in [p1, p2]:
-            if pokemon.status == StatusCondition.BURN:
-                damage = max(1, pokemon.max_hp // 8)
-                pokemon.take_damage(damage)
-                self.log_message(f"{pokemon.name} was hurt by its burn!")
-            elif pokemon.status == StatusCondition.POISON:
-                damage = max(1, pokemon.max_hp // 8)
-                pokemon.take_damage(damage)
-                self.log_message(f"{pokemon.name} was hurt by poison!")
-            elif pokemon.status == StatusCondition.TOXIC:
+        for pokemon in (p1, p2):
+            entry = _STATUS_DAMAGE[pokemon.status]
+            if entry is None:
+                continue
+            divisor, message = entry
+            
+            multiplier = 1
+            if pokemon.status == StatusCondition.TOXIC:
                 # Toxic poison increases each turn
-                if 'toxic_counter' not in pokemon.volatile_status:
-                    pokemon.volatile_status.add('toxic_counter')
+                if not pokemon.volatile_status & VolatileStatus.TOXIC_COUNTER:
+                    pokemon.volatile_status |= VolatileStatus.TOXIC_COUNTER
                     pokemon.toxic_counter = 1
                 else:
                     pokemon.toxic_counter += 1
-                damage = max(1, (pokemon.max_hp * pokemon.toxic_counter) // 16)
-                pokemon.take_damage(damage)
-                self.log_message(f"{pokemon.name} was hurt by toxic!")
+                multiplier = pokemon.toxic_counter
+            
+            pokemon.take_damage(max(1, (pokemon.max_hp * multiplier) // divisor))
+            if not self.silent:
+                self.log_message(f"{pokemon.name} {message}")
         
         # Decrease weather turns
         # ...
+        
+        # Stat caches only live for a turn, in case a stat changed other than
+        # through modify_stat_stage
+        p1.clear_stat_cache()
+        p2.clear_stat_cache()
     
     def _is_battle_over(self) -> bool:
         """Check if the battle is over.
@@ -452,9 +678,25 @@ class Battle:
         Returns:
             bool: True if the battle is over, False otherwise
         """
-        team1_alive = any(not pokemon.is_fainted() for pokemon in self.team1)
-        team2_alive = any(not pokemon.is_fainted() for pokemon in self.team2)
-        return not (team1_alive and team2_alive)
+        return self._alive_count[0] == 0 or self._alive_count[1] == 0
+    
+    def _on_faint(self, team_idx: int, pokemon: Pokemon) -> None:
+        """Record that a Pokémon has fainted.
+        
+        Args:
+            team_idx (int): 0 for team 1, 1 for team 2
+            pokemon (Pokemon): The Pokémon that fainted
+        """
+        self._alive_count[team_idx] -= 1
+    
+    def _on_revive(self, team_idx: int, pokemon: Pokemon) -> None:
+        """Record that a fainted Pokémon has been healed back into the battle.
+        
+        Args:
+            team_idx (int): 0 for team 1, 1 for team 2
+            pokemon (Pokemon): The Pokémon that was revived
+        """
+        self._alive_count[team_idx] += 1
     
     def _select_replacement(self, fainted: Pokemon, team: List[Pokemon], team_name: str) -> Optional[Pokemon]:
         """Select a replacement for a fainted Pokémon.
@@ -467,17 +709,19 @@ class Battle:
         Returns:
             Optional[Pokemon]: The selected Pokémon, or None if no valid choices
         """
-        available = [p for p in team if not p.is_fainted() and p != fainted]
-        if not available:
-            return None
-        
         # Simple AI: Choose the Pokémon with the highest HP
-        return max(available, key=lambda p: p.hp)
+        order = self._replacement_order.get(id(team))
+        if order is None:
+            order = sorted(team, key=lambda p: p.hp, reverse=True)
+        for pokemon in order:
+            if pokemon is not fainted and not pokemon.is_fainted():
+                return pokemon
+        return None
     
     def _end_battle(self) -> None:
         """Handle the end of the battle."""
-        team1_alive = any(not pokemon.is_fainted() for pokemon in self.team1)
-        team2_alive = any(not pokemon.is_fainted() for pokemon in self.team2)
+        team1_alive = self._alive_count[0] > 0
+        team2_alive = self._alive_count[1] > 0
         
         if team1_alive and not team2_alive:
             self.log_message("\nTeam 1 wins the battle!")
@@ -487,13 +731,36 @@ class Battle:
             self.log_message("\nThe battle ended in a draw!")
     
     def log_message(self, message: str) -> None:
-        """Log a battle message.
+        """Log a plain battle message.
         
         Args:
             message (str): The message to log
         """
-        print(message)
-        self.log.append(message)
+        self._log(EventKind.MESSAGE, message)
+    
+    def _log(self, kind: EventKind, *args: Any) -> None:
+        """Record a log entry, rendering it only if it is printed.
+        
+        Args:
+            kind (EventKind): What happened
+            *args: The values the entry's message template is filled with
+        """
+        if self.silent:
+            return
+        entry = (kind, *args)
+        self.log.append(entry)
+        print(format_log_entry(entry))
+    
+    def format_log(self, color: bool = False) -> List[str]:
+        """Render the battle log as text.
+        
+        Args:
+            color (bool): Whether to include ANSI color codes
+            
+        Returns:
+            List[str]: One rendered message per log entry
+        """
+        return [format_log_entry(entry, color) for entry in self.log]
 
 def create_sample_battle() -> Battle:
     """Create a sample battle for testing.
@@ -1,6 +1,35 @@
 """Enums for Pokémon battle system."""
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, IntFlag, auto
+
+class Type(IntEnum):
+    """Pokémon types, numbered to index the type effectiveness chart."""
+    NORMAL = 0
+    FIRE = 1
+    WATER = 2
+    ELECTRIC = 3
+    GRASS = 4
+    ICE = 5
+    FIGHTING = 6
+    POISON = 7
+    GROUND = 8
+    FLYING = 9
+    PSYCHIC = 10
+    BUG = 11
+    ROCK = 12
+    GHOST = 13
+    DRAGON = 14
+    DARK = 15
+    STEEL = 16
+    FAIRY = 17
+
+class EventKind(IntEnum):
+    """Kinds of entries in a battle log."""
+    MESSAGE = 0      # Plain text: (message,)
+    SEND_OUT_P1 = 1  # Team 1 sends out a Pokémon: (name,)
+    SEND_OUT_P2 = 2  # Team 2 sends out a Pokémon: (name,)
+    TURN_START = 3   # A new turn begins: (turn,)
+    MOVE_USED = 4    # A Pokémon uses a move: (pokemon name, move name)
 
 class MoveCategory(Enum):
     """Categories of moves in Pokémon battles."""
@@ -8,6 +37,20 @@ class MoveCategory(Enum):
     SPECIAL = "Special"
     STATUS = "Status"
 
+class MoveFlags(IntFlag):
+    """Boolean move properties, packed into Move.flag_bits.
+    
+    Member names match the (upper-cased) keys of a move's ``flags`` dict.
+    """
+    NONE = 0
+    HIGH_CRIT = 1 << 0
+    CONTACT = 1 << 1
+    SOUND = 1 << 2
+    PUNCH = 1 << 3
+    BITE = 1 << 4
+    PULSE = 1 << 5
+    PROTECT = 1 << 6
+
 class Weather(Enum):
     """Weather conditions that can affect battles."""
     CLEAR = "Clear Skies"
@@ -36,49 +79,50 @@ class SideCondition(Enum):
     REFLECT = "Reflect"
     AURORA_VEIL = "Aurora Veil"
 
-class StatusCondition(Enum):
+class StatusCondition(IntEnum):
     """Non-volatile status conditions in Pokémon battles."""
-    NONE = None
-    POISON = "poison"
-    TOXIC = "toxic"
-    BURN = "burn"
-    FREEZE = "freeze"
-    PARALYSIS = "paralysis"
-    SLEEP = "sleep"
-    FAINTED = "fainted"
+    NONE = 0
+    POISON = 1
+    TOXIC = 2
+    BURN = 3
+    FREEZE = 4
+    PARALYSIS = 5
+    SLEEP = 6
+    FAINTED = 7
 
-class VolatileStatus(Enum):
-    """Volatile status conditions in Pokémon battles."""
-    CONFUSED = "confused"
-    FLINCH = "flinch"
-    LEECH_SEED = "leech_seed"
-    PERISH_SONG = "perish_song"
-    TAUNT = "taunt"
-    ENCORE = "encore"
-    DISABLE = "disable"
-    TORMENT = "torment"
-    IDENTIFIED = "identified"  # For Foresight, Odor Sleuth, etc.
-    TELEKINESIS = "telekinesis"
-    HEAL_BLOCK = "heal_block"
-    EMBARGO = "embargo"
-    POWER_TRICK = "power_trick"
-    ILLUSION = "illusion"  # For Zorua/Zoroark
-    AQUA_RING = "aqua_ring"
-    ROOTED = "rooted"  # For Ingrain
-    MAGIC_COAT = "magic_coat"
-    SUBSTITUTE = "substitute"
-    DESTINY_BOND = "destiny_bond"
-    GRUDGE = "grudge"
-    NIGHTMARE = "nightmare"
-    CURSED = "cursed"
-    EMBER = "ember"  # For Fire Spin, etc.
-    WRAP = "wrap"  # For Wrap, Bind, etc.
-    MINIMIZE = "minimize"  # For Stomp, etc.
-    CHARGING = "charging"  # For Solar Beam, etc.
-    RECHARGE = "recharge"  # For Hyper Beam, etc.
-    RAMPAGE = "rampage"  # For Thrash, Outrage, etc.
-    PROTECT = "protect"  # For Protect, Detect, etc.
-    ENDURE = "endure"  # For Endure
-    FOCUS_ENERGY = "focus_energy"  # For Focus Energy
-    LOCKED_IN = "locked_in"  # For Choice items
-    MAGNET_RISE = "magnet_rise"  # For Magnet Rise
+class VolatileStatus(IntFlag):
+    """Volatile status conditions in Pokémon battles, combinable as bit flags."""
+    CONFUSED = 1 << 0
+    FLINCH = 1 << 1
+    LEECH_SEED = 1 << 2
+    PERISH_SONG = 1 << 3
+    TAUNT = 1 << 4
+    ENCORE = 1 << 5
+    DISABLE = 1 << 6
+    TORMENT = 1 << 7
+    IDENTIFIED = 1 << 8  # For Foresight, Odor Sleuth, etc.
+    TELEKINESIS = 1 << 9
+    HEAL_BLOCK = 1 << 10
+    EMBARGO = 1 << 11
+    POWER_TRICK = 1 << 12
+    ILLUSION = 1 << 13  # For Zorua/Zoroark
+    AQUA_RING = 1 << 14
+    ROOTED = 1 << 15  # For Ingrain
+    MAGIC_COAT = 1 << 16
+    SUBSTITUTE = 1 << 17
+    DESTINY_BOND = 1 << 18
+    GRUDGE = 1 << 19
+    NIGHTMARE = 1 << 20
+    CURSED = 1 << 21
+    EMBER = 1 << 22  # For Fire Spin, etc.
+    WRAP = 1 << 23  # For Wrap, Bind, etc.
+    MINIMIZE = 1 << 24  # For Stomp, etc.
+    CHARGING = 1 << 25  # For Solar Beam, etc.
+    RECHARGE = 1 << 26  # For Hyper Beam, etc.
+    RAMPAGE = 1 << 27  # For Thrash, Outrage, etc.
+    PROTECT = 1 << 28  # For Protect, Detect, etc.
+    ENDURE = 1 << 29  # For Endure
+    FOCUS_ENERGY = 1 << 30  # For Focus Energy
+    LOCKED_IN = 1 << 31  # For Choice items
+    MAGNET_RISE = 1 << 32  # For Magnet Rise
+    TOXIC_COUNTER = 1 << 33  # For Toxic's escalating damage
@@ -0,0 +1,48 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled core of the per-frame sprite animation update.
+
+Same logic as ``_anim_core_py.animation_step``; build it in place with
+``cythonize -i pokemon_battle_system/gui/_anim_core_c.pyx``.
+"""
+
+from libc.math cimport sin, M_PI
+
+# Animation state codes understood by animation_step
+IDLE = 0
+ATTACK = 1
+DAMAGE = 2
+
+cdef enum:
+    BOB_STEPS = 256
+
+cdef double BOB_TABLE[BOB_STEPS]
+cdef double BOB_STEPS_PER_SECOND = 2 * BOB_STEPS / (2 * M_PI)
+
+cdef int _i
+for _i in range(BOB_STEPS):
+    BOB_TABLE[_i] = sin(_i * 2 * M_PI / BOB_STEPS) * 2
+
+
+cpdef tuple animation_step(int state, double timer, bint is_player,
+                           double offset_x, double offset_y, int alpha):
+    """Advance a sprite's animation to the given time.
+
+    Returns:
+        tuple: (offset_x, offset_y, alpha, finished)
+    """
+    cdef bint finished = False
+    if state == 0:  # IDLE
+        offset_y = BOB_TABLE[<int>(timer * BOB_STEPS_PER_SECOND) % BOB_STEPS]
+    elif state == 1:  # ATTACK
+        if timer < 0.1:
+            offset_x = 30 if is_player else -30
+        elif timer < 0.2:
+            offset_x = 0
+            finished = True
+    elif state == 2:  # DAMAGE
+        if timer < 0.6:
+            alpha = 100 if <int>(timer * 10) % 2 == 0 else 255
+        else:
+            alpha = 255
+            finished = True
+    return offset_x, offset_y, alpha, finished
@@ -0,0 +1,52 @@
+"""Pure-Python core of the per-frame sprite animation update.
+
+Used when the compiled ``_anim_core_c`` extension has not been built.
+"""
+
+import math
+
+# Animation state codes understood by animation_step
+IDLE = 0
+ATTACK = 1
+DAMAGE = 2
+
+# Idle bob offsets (2px amplitude) over one sine period, looked up per frame
+# instead of calling math.sin; the bob advances 2 radians per second
+BOB_STEPS = 256
+BOB_TABLE = tuple(math.sin(i * 2 * math.pi / BOB_STEPS) * 2 for i in range(BOB_STEPS))
+BOB_STEPS_PER_SECOND = 2 * BOB_STEPS / (2 * math.pi)
+
+
+def animation_step(state: int, timer: float, is_player: bool,
+                   offset_x: float, offset_y: float, alpha: int) -> tuple:
+    """Advance a sprite's animation to the given time.
+
+    Args:
+        state: Animation state code (IDLE, ATTACK or DAMAGE; others are left as is)
+        timer: Seconds since the animation started
+        is_player: Whether this is the player's sprite (attacks lunge right)
+        offset_x, offset_y, alpha: The sprite's current drawing parameters
+
+    Returns:
+        tuple: (offset_x, offset_y, alpha, finished), where finished means the
+        animation is over and the sprite should go back to idle
+    """
+    finished = False
+    if state == IDLE:
+        # Gentle bobbing animation
+        offset_y = BOB_TABLE[int(timer * BOB_STEPS_PER_SECOND) % BOB_STEPS]
+    elif state == ATTACK:
+        # Attack animation (move forward and back)
+        if timer < 0.1:
+            offset_x = 30 if is_player else -30
+        elif timer < 0.2:
+            offset_x = 0
+            finished = True
+    elif state == DAMAGE:
+        # Damage animation (flash red)
+        if timer < 0.6:
+            alpha = 100 if int(timer * 10) % 2 == 0 else 255
+        else:
+            alpha = 255
+            finished = True
+    return offset_x, offset_y, alpha, finished
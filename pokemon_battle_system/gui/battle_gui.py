@@ -4,13 +4,11 @@ Battle GUI for Pokémon battles using Pygame.
 This module provides a graphical interface for the Pokémon battle system.
 """
 
-import os
 import sys
 import pygame
-import time
 from typing import List, Tuple, Dict, Optional, Any, Callable
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import IntEnum
 import math
 import random
 from pathlib import Path
@@ -18,8 +16,11 @@ from pathlib import Path
 # Import sprite manager
 from .sprite_manager import SpriteManager
 
-# Import enums
-from ..enums import MoveCategory
+# Per-frame animation math, compiled if the Cython extension has been built
+try:
+    from . import _anim_core_c as _anim_core
+except ImportError:
+    from . import _anim_core_py as _anim_core
 
 # Initialize pygame
 pygame.init()
@@ -29,6 +30,7 @@ pygame.mixer.init()
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+IDLE_FPS = 15  # Frame rate while nothing on screen is changing
 
 # Colors
 WHITE = (255, 255, 255)
@@ -42,14 +44,20 @@ LIGHT_BLUE = (135, 206, 235)
 DARK_GRAY = (100, 100, 100)
 LIGHT_GRAY = (220, 220, 220)
 
-# Animation states
-class AnimationState(Enum):
-    IDLE = "idle"
-    ATTACK = "attack"
-    DAMAGE = "damage"
-    FAINT = "faint"
-    SWITCH_IN = "switch_in"
-    SWITCH_OUT = "switch_out"
+# Rendered text surfaces kept before the cache is flushed
+TEXT_CACHE_SIZE = 256
+
+# Bound once for auto-battle move picks
+_randrange = random.randrange
+
+# Animation states; the values are the state codes used by _anim_core
+class AnimationState(IntEnum):
+    IDLE = _anim_core.IDLE
+    ATTACK = _anim_core.ATTACK
+    DAMAGE = _anim_core.DAMAGE
+    FAINT = 3
+    SWITCH_IN = 4
+    SWITCH_OUT = 5
 
 @dataclass
 class SpriteAnimation:
@@ -90,9 +98,28 @@ class SpriteAnimation:
         self.frame_timer = 0
         self.done = False
 
+@dataclass(slots=True, eq=False)
+class PokemonSpriteState:
+    """On-screen state of a battling Pokémon's sprite."""
+    pokemon: Any
+    position: Tuple[int, int]
+    state: AnimationState = AnimationState.IDLE
+    sprite: Optional[pygame.Surface] = None  # Set by BattleGUI._ensure_sprite_loaded
+    anim_timer: float = 0
+    offset_x: float = 0
+    offset_y: float = 0
+    scale: float = 1.0
+    alpha: int = 255
+    # Alpha/scale variants of `sprite`, built by BattleGUI._sprite_variant
+    variants: Dict[Tuple[float, int], pygame.Surface] = field(default_factory=dict)
+    variants_base: Optional[pygame.Surface] = None
+
 class BattleGUI:
     """Main class for the battle GUI."""
     
+    ASSETS_DIR = Path("assets")
+    _assets_dir_checked = False
+    
     def __init__(self, battle):
         """Initialize the battle GUI.
         
@@ -105,6 +132,9 @@ class BattleGUI:
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # The GUI is keyboard-driven; don't let mouse movement flood the event queue
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
         # Load assets
         self._load_assets()
         
@@ -113,6 +143,21 @@ class BattleGUI:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_large = pygame.font.Font(None, 48)
         
+        # (surface, position[, area]) blits waiting to be drawn by _flush_blits
+        self._blit_queue: List[tuple] = []
+        
+        # Screen areas drawn over the static background this frame and last frame;
+        # only these are pushed to the display (see _present)
+        self._dirty_rects: List[pygame.Rect] = []
+        self._prev_dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+        
+        # Rendered text surfaces, keyed by (font id, text, color)
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Set whenever something visible changes; frames are only drawn when it is
+        self._needs_redraw = True
+        
         # Battle state
         self.message = ""
         self.message_timer = 0
@@ -120,6 +165,8 @@ class BattleGUI:
         
         # Animation state
         self.animations = []
+        self._animating = False  # Whether a sprite is attacking or taking damage
+        self._idle_anim_timer = 0.0  # Time since idle sprites were last stepped
         
         # Set up Pokémon sprites
         self.player_pokemon_sprite = None
@@ -132,38 +179,55 @@ class BattleGUI:
         self.show_move_menu = False
         self.move_menu_index = 0
         
+        # Menus are drawn from pre-composed surfaces: one main menu per
+        # highlighted option, and the move menu per Pokémon, rebuilt when
+        # the highlighted move or the moves' PP change
+        self._main_menu_surfaces = [self._build_main_menu(i) for i in range(len(self.menu_options))]
+        self._move_menu_cache: Dict[int, Tuple[Any, pygame.Surface]] = {}
+        
         # Battle state
         self.waiting_for_input = True
     
     def _load_assets(self):
         """Load all required assets."""
-        # Create assets directory if it doesn't exist
-        if not os.path.exists("assets"):
-            os.makedirs("assets")
+        self._ensure_assets_dir()
         
         # Load background
-        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         self.background.fill(LIGHT_BLUE)  # Sky blue background
         
-        # Load battle UI elements
+        # Load battle UI elements; all are opaque, so convert() them to the
+        # display's pixel format for plain-copy blits
         self.battle_ui = {
-            'panel': pygame.Surface((SCREEN_WIDTH, 200)),
-            'hp_bar': pygame.Surface((200, 20)),
-            'hp_bar_fill': pygame.Surface((196, 16)),
-            'menu': pygame.Surface((300, 150)),
-            'menu_highlight': pygame.Surface((140, 60)),
+            'panel': pygame.Surface((SCREEN_WIDTH, 200)).convert(),
+            'hp_bar': pygame.Surface((200, 20)).convert(),
+            'hp_bar_fill': pygame.Surface((196, 16)).convert(),
+            'menu': pygame.Surface((300, 150)).convert(),
+            'menu_highlight': pygame.Surface((140, 60)).convert(),
         }
         
         # Style UI elements
         self.battle_ui['panel'].fill((230, 230, 230))
         self.battle_ui['menu'].fill((250, 250, 250))
         self.battle_ui['menu_highlight'].fill((200, 200, 255))
+        self.battle_ui['hp_bar'].fill(DARK_GRAY)
+        
+        # Full-width HP bar fills in each colour; bars blit the part they need
+        self._hp_bar_fills = {}
+        for color in (GREEN, YELLOW, RED):
+            self._hp_bar_fills[color] = self.battle_ui['hp_bar_fill'].copy()
+            self._hp_bar_fills[color].fill(color)
         
         # Draw borders
         pygame.draw.rect(self.battle_ui['panel'], DARK_GRAY, self.battle_ui['panel'].get_rect(), 2)
         pygame.draw.rect(self.battle_ui['menu'], DARK_GRAY, self.battle_ui['menu'].get_rect(), 2)
         pygame.draw.rect(self.battle_ui['menu_highlight'], BLUE, self.battle_ui['menu_highlight'].get_rect(), 2)
         
+        # Fonts and text that never change, created once instead of per call
+        self._font_auto = pygame.font.Font(None, 24)
+        self._font_placeholder = pygame.font.Font(None, 20)
+        self._auto_surface = self._font_auto.render("AUTO", True, RED)
+        
         # Initialize Pokémon sprites and battle state
         self.pokemon_sprites = {}
         if not hasattr(self, 'sprite_manager'):
@@ -174,36 +238,30 @@ class BattleGUI:
         self.auto_battle_delay = 1.0  # seconds between turns
         self.last_auto_action = 0
     
-    def _load_pokemon_sprites(self):
-        """Load or download Pokémon sprites."""
-        if not hasattr(self, 'sprite_manager'):
-            self.sprite_manager = SpriteManager()
-            
-        if self.player_pokemon_sprite and 'pokemon' in self.player_pokemon_sprite:
-            pokemon = self.player_pokemon_sprite['pokemon']
-            sprite = self.sprite_manager.get_pokemon_sprite(pokemon.name)
-            if sprite:
-                # Scale the sprite to a reasonable size
-                scaled_sprite = self.sprite_manager.scale_sprite(sprite, 200)
-                if scaled_sprite:
-                    self.player_pokemon_sprite['sprite'] = scaled_sprite
-                else:
-                    self._create_placeholder_sprite(pokemon, is_player=True)
-            else:
-                self._create_placeholder_sprite(pokemon, is_player=True)
-    
-        if self.opponent_pokemon_sprite and 'pokemon' in self.opponent_pokemon_sprite:
-            pokemon = self.opponent_pokemon_sprite['pokemon']
-            sprite = self.sprite_manager.get_pokemon_sprite(pokemon.name)
-            if sprite:
-                # Scale the sprite to a reasonable size
-                scaled_sprite = self.sprite_manager.scale_sprite(sprite, 200)
-                if scaled_sprite:
-                    self.opponent_pokemon_sprite['sprite'] = scaled_sprite
-                else:
-                    self._create_placeholder_sprite(pokemon, is_player=False)
-            else:
-                self._create_placeholder_sprite(pokemon, is_player=False)
+    @classmethod
+    def _ensure_assets_dir(cls):
+        """Create the assets directory if it doesn't exist (checked once per run)."""
+        if not cls._assets_dir_checked:
+            cls.ASSETS_DIR.mkdir(exist_ok=True)
+            cls._assets_dir_checked = True
+    
+    def _ensure_sprite_loaded(self, pokemon_sprite):
+        """Load or download a battling Pokémon's sprite the first time it is drawn.
+        
+        The sprite manager keeps the scaled sprite, so switching back to a
+        Pokémon seen earlier reuses its surface.
+        """
+        if pokemon_sprite.sprite is not None:
+            return
+        
+        pokemon = pokemon_sprite.pokemon
+        # Scale the sprite to a reasonable size
+        scaled_sprite = self.sprite_manager.get_scaled_sprite(pokemon.name, 200)
+        if scaled_sprite:
+            pokemon_sprite.sprite = scaled_sprite
+        else:
+            is_player = pokemon_sprite is self.player_pokemon_sprite
+            pokemon_sprite.sprite = self._create_placeholder_sprite(pokemon, is_player)
     
     def _create_placeholder_sprite(self, pokemon, is_player=True):
         """Create a placeholder sprite if loading the real one fails."""
@@ -212,15 +270,12 @@ class BattleGUI:
         pygame.draw.rect(sprite, color, (0, 0, 120, 120), border_radius=10)
         
         # Add Pokémon name
-        font = pygame.font.Font(None, 20)
-        text = font.render(pokemon.name, True, (255, 255, 255))
+        text = self._font_placeholder.render(pokemon.name, True, (255, 255, 255))
         text_rect = text.get_rect(center=(60, 60))
         sprite.blit(text, text_rect)
         
-        if is_player:
-            self.player_pokemon_sprite['sprite'] = sprite
-        else:
-            self.opponent_pokemon_sprite['sprite'] = sprite
+        # Match the display's pixel format so per-frame blits don't convert
+        return sprite.convert_alpha()
     
     def setup_pokemon_sprites(self):
         """Set up Pokémon sprites for the battle."""
@@ -231,46 +286,39 @@ class BattleGUI:
         # Find the first non-fainted Pokémon on each team
         for pokemon in self.battle.team1:
             if not pokemon.is_fainted():
-                self.player_pokemon_sprite = {
-                    'pokemon': pokemon,
-                    'position': (200, 300),
-                    'state': AnimationState.IDLE,
-                    'sprite': None,  # Will be loaded by _load_pokemon_sprites
-                    'anim_timer': 0,
-                    'offset_x': 0,
-                    'offset_y': 0,
-                    'scale': 1.0,
-                    'alpha': 255
-                }
+                self.player_pokemon_sprite = PokemonSpriteState(pokemon, (200, 300))
                 break
                 
         for pokemon in self.battle.team2:
             if not pokemon.is_fainted():
-                self.opponent_pokemon_sprite = {
-                    'pokemon': pokemon,
-                    'position': (600, 150),
-                    'state': AnimationState.IDLE,
-                    'sprite': None,  # Will be loaded by _load_pokemon_sprites
-                    'anim_timer': 0,
-                    'offset_x': 0,
-                    'offset_y': 0,
-                    'scale': 1.0,
-                    'alpha': 255
-                }
+                self.opponent_pokemon_sprite = PokemonSpriteState(pokemon, (600, 150))
                 break
         
-        # Load the sprites
-        self._load_pokemon_sprites()
+        # Sprites are loaded when first drawn, see _ensure_sprite_loaded
+    
+    @property
+    def message(self) -> str:
+        """The message shown in the message box ("" for none)."""
+        return self._message
+    
+    @message.setter
+    def message(self, message: str) -> None:
+        # Wrap and render the lines once here rather than on every frame
+        self._message = message
+        self._needs_redraw = True
+        self._message_line_surfs = [
+            self.font_medium.render(line, True, BLACK) for line in self._wrap_text(message)
+        ] if message else []
     
     def run(self):
         """Run the main game loop."""
-        last_time = time.time()
+        # Start timing from here rather than from when the clock was created
+        self.clock.tick()
+        frame_rate = FPS
         
         while self.running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
+            # Cap the frame rate; tick() returns the milliseconds since the last frame
+            dt = self.clock.tick(frame_rate) / 1000
             
             # Handle events
             self._handle_events()
@@ -278,25 +326,25 @@ class BattleGUI:
             # Update game state
             self._update(dt)
             
-            # Draw everything
-            self._draw()
-            
-            # Cap the frame rate
-            self.clock.tick(FPS)
-            
-            # Update the display
-            pygame.display.flip()
+            # Draw everything, unless the last frame is still up to date
+            if self._needs_redraw:
+                self._draw()
+                self._present()
+                self._needs_redraw = False
+                frame_rate = FPS
+            else:
+                # Nothing is changing; poll at a lower rate to save CPU
+                frame_rate = IDLE_FPS
     
     def _handle_events(self):
         """Handle pygame events."""
-        current_time = time.time()
-        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 self._handle_keydown(event.key)
             elif event.type == pygame.USEREVENT and self.auto_battle:
+                self._needs_redraw = True
                 # Auto-battle: Make a random move for the player
                 if not self.show_move_menu and not self.waiting_for_input:
                     self._auto_battle_move()
@@ -306,7 +354,9 @@ class BattleGUI:
         """Handle key press events."""
         if not self.waiting_for_input:
             return
-            
+        
+        self._needs_redraw = True
+        
         if key == pygame.K_ESCAPE:
             self.running = False
         elif key == pygame.K_RETURN or key == pygame.K_SPACE:
@@ -336,7 +386,7 @@ class BattleGUI:
         """Handle confirm button press."""
         if self.show_move_menu:
             # Select a move
-            pokemon = self.player_pokemon_sprite['pokemon']
+            pokemon = self.player_pokemon_sprite.pokemon
             if 0 <= self.move_menu_index < len(pokemon.moves):
                 selected_move = pokemon.moves[self.move_menu_index]
                 self.message = f"{pokemon.name} used {selected_move.name}!"
@@ -344,15 +394,15 @@ class BattleGUI:
                 self.waiting_for_input = False
                 
                 # Execute the move
-                self._execute_move(pokemon, selected_move, self.opponent_pokemon_sprite['pokemon'])
+                self._execute_move(pokemon, selected_move, self.opponent_pokemon_sprite.pokemon)
                 
                 # Auto-battle: Let the opponent make a move
-                if self.auto_battle and not self.opponent_pokemon_sprite['pokemon'].is_fainted():
+                if self.auto_battle and not self.opponent_pokemon_sprite.pokemon.is_fainted():
                     pygame.time.set_timer(pygame.USEREVENT, int(self.auto_battle_delay * 1000))
         else:
             # Main menu selection
             if self.selected_menu == 0:  # Fight
-                if self.player_pokemon_sprite['pokemon'].moves:
+                if self.player_pokemon_sprite.pokemon.moves:
                     self.show_move_menu = True
                     self.move_menu_index = 0
                 else:
@@ -377,41 +427,56 @@ class BattleGUI:
                 self.message = ""
                 self.waiting_for_input = True
         
-        # Update Pokémon animations
-        self._update_pokemon_animation(dt, self.player_pokemon_sprite)
-        self._update_pokemon_animation(dt, self.opponent_pokemon_sprite)
+        # Update Pokémon animations. Attacks and damage flashes are stepped
+        # every frame; the idle bob only needs it IDLE_FPS times a second.
+        self._idle_anim_timer += dt
+        step = self._animating or self._idle_anim_timer >= 1 / IDLE_FPS
+        if step:
+            self._idle_anim_timer = 0.0
+        self._update_pokemon_animation(dt, self.player_pokemon_sprite, step)
+        self._update_pokemon_animation(dt, self.opponent_pokemon_sprite, step)
+        if step:
+            self._animating = any(
+                sprite and sprite.state in (AnimationState.ATTACK, AnimationState.DAMAGE)
+                for sprite in (self.player_pokemon_sprite, self.opponent_pokemon_sprite))
     
-    def _update_pokemon_animation(self, dt, pokemon_sprite):
-        """Update a Pokémon's animation."""
+    def _update_pokemon_animation(self, dt, pokemon_sprite, step=True):
+        """Update a Pokémon's animation.
+        
+        The animation timer always advances; the sprite's offsets and alpha
+        are only recomputed if `step` is set.
+        """
         if not pokemon_sprite:
             return
             
-        pokemon_sprite['anim_timer'] += dt
+        pokemon_sprite.anim_timer += dt
+        if not step:
+            return
+        
+        # Sprites are blitted at whole-pixel positions, so sub-pixel movement
+        # of the idle bob doesn't need a redraw
+        before = (pokemon_sprite.offset_x, math.floor(pokemon_sprite.offset_y),
+                  pokemon_sprite.alpha)
         
         # Handle different animation states
-        if pokemon_sprite['state'] == AnimationState.IDLE:
-            # Gentle bobbing animation
-            pokemon_sprite['offset_y'] = math.sin(pokemon_sprite['anim_timer'] * 2) * 2
-        elif pokemon_sprite['state'] == AnimationState.ATTACK:
-            # Attack animation (move forward and back)
-            if pokemon_sprite['anim_timer'] < 0.1:
-                pokemon_sprite['offset_x'] = 30 if pokemon_sprite == self.player_pokemon_sprite else -30
-            elif pokemon_sprite['anim_timer'] < 0.2:
-                pokemon_sprite['offset_x'] = 0
-                pokemon_sprite['state'] = AnimationState.IDLE
-        elif pokemon_sprite['state'] == AnimationState.DAMAGE:
-            # Damage animation (flash red)
-            if pokemon_sprite['anim_timer'] < 0.6:
-                if int(pokemon_sprite['anim_timer'] * 10) % 2 == 0:
-                    pokemon_sprite['alpha'] = 100
-                else:
-                    pokemon_sprite['alpha'] = 255
-            else:
-                pokemon_sprite['alpha'] = 255
-                pokemon_sprite['state'] = AnimationState.IDLE
+        (pokemon_sprite.offset_x, pokemon_sprite.offset_y,
+         pokemon_sprite.alpha, finished) = _anim_core.animation_step(
+            pokemon_sprite.state, pokemon_sprite.anim_timer,
+            pokemon_sprite is self.player_pokemon_sprite,
+            pokemon_sprite.offset_x, pokemon_sprite.offset_y, pokemon_sprite.alpha)
+        if finished:
+            pokemon_sprite.state = AnimationState.IDLE
+        
+        if before != (pokemon_sprite.offset_x, math.floor(pokemon_sprite.offset_y),
+                      pokemon_sprite.alpha):
+            self._needs_redraw = True
     
     def _draw(self):
         """Draw everything to the screen."""
+        # Blits are queued and drawn in batches by _flush_blits
+        self._blit_queue.clear()
+        self._dirty_rects = []
+        
         # Draw background
         self.screen.blit(self.background, (0, 0))
         
@@ -420,9 +485,7 @@ class BattleGUI:
         
         # Draw auto-battle indicator
         if self.auto_battle:
-            font = pygame.font.Font(None, 24)
-            auto_text = font.render("AUTO", True, (255, 0, 0))
-            self.screen.blit(auto_text, (SCREEN_WIDTH - 60, 10))
+            self._blit_queue.append((self._auto_surface, (SCREEN_WIDTH - 60, 10)))
         
         # Draw Pokémon sprites
         self._draw_pokemon(self.player_pokemon_sprite)
@@ -437,48 +500,106 @@ class BattleGUI:
                 self._draw_move_menu()
             else:
                 self._draw_main_menu()
+        
+        self._flush_blits()
+    
+    def _flush_blits(self):
+        """Draw all queued blits in one Surface.blits call.
+        
+        Must be called before drawing shapes directly on the screen so they
+        stay layered in drawing order.
+        """
+        if self._blit_queue:
+            self._dirty_rects.extend(self.screen.blits(self._blit_queue))
+            self._blit_queue.clear()
+    
+    def _present(self):
+        """Push the frame to the display, updating only the areas that changed.
+        
+        An area needs updating if something was drawn over the static
+        background there this frame or the last one. Falls back to a full
+        flip for the first frame or when most of the screen is dirty.
+        """
+        rects = self._prev_dirty_rects + self._dirty_rects
+        dirty_area = sum(rect.width * rect.height for rect in rects)
+        if self._full_redraw or dirty_area > SCREEN_WIDTH * SCREEN_HEIGHT // 2:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(rects)
+        self._prev_dirty_rects = self._dirty_rects
     
     def _draw_pokemon(self, pokemon_sprite):
         """Draw a Pokémon sprite with its current animation state."""
-        if not pokemon_sprite or not pokemon_sprite['sprite']:
+        if not pokemon_sprite:
             return
-            
-        # Create a copy of the sprite to apply transformations
-        sprite = pokemon_sprite['sprite'].copy()
-        
-        # Apply alpha if needed
-        if pokemon_sprite['alpha'] < 255:
-            sprite.fill((255, 255, 255, pokemon_sprite['alpha']), None, pygame.BLEND_RGBA_MULT)
+        self._ensure_sprite_loaded(pokemon_sprite)
         
-        # Apply scale if needed
-        if pokemon_sprite['scale'] != 1.0:
-            new_width = int(sprite.get_width() * pokemon_sprite['scale'])
-            new_height = int(sprite.get_height() * pokemon_sprite['scale'])
-            sprite = pygame.transform.scale(sprite, (new_width, new_height))
+        # Untransformed sprites (the common idle case) are drawn as they are
+        if pokemon_sprite.scale == 1.0 and pokemon_sprite.alpha == 255:
+            sprite = pokemon_sprite.sprite
+        else:
+            sprite = self._sprite_variant(pokemon_sprite)
         
         # Get position with offset
-        x = pokemon_sprite['position'][0] + pokemon_sprite['offset_x']
-        y = pokemon_sprite['position'][1] + pokemon_sprite['offset_y']
+        x = pokemon_sprite.position[0] + pokemon_sprite.offset_x
+        y = pokemon_sprite.position[1] + pokemon_sprite.offset_y
         
         # Draw the sprite
-        self.screen.blit(sprite, (x - sprite.get_width() // 2, y - sprite.get_height() // 2))
+        self._blit_queue.append((sprite, (x - sprite.get_width() // 2, y - sprite.get_height() // 2)))
         
         # Draw HP bar if applicable
-        if pokemon_sprite == self.player_pokemon_sprite:
+        if pokemon_sprite is self.player_pokemon_sprite:
             self._draw_hp_bar(pokemon_sprite, 50, SCREEN_HEIGHT - 180)
         else:
             self._draw_hp_bar(pokemon_sprite, SCREEN_WIDTH - 250, 50)
     
+    def _sprite_variant(self, pokemon_sprite):
+        """Get the sprite with the current alpha and scale applied.
+        
+        Variants are built once and reused; the damage flash only ever
+        alternates between two alpha values.
+        """
+        base = pokemon_sprite.sprite
+        variants = pokemon_sprite.variants
+        if pokemon_sprite.variants_base is not base:
+            variants.clear()
+            pokemon_sprite.variants_base = base
+        
+        key = (pokemon_sprite.scale, pokemon_sprite.alpha)
+        sprite = variants.get(key)
+        if sprite is not None:
+            return sprite
+        
+        sprite = base
+        
+        # Apply alpha if needed
+        if pokemon_sprite.alpha < 255:
+            sprite = sprite.copy()
+            sprite.fill((255, 255, 255, pokemon_sprite.alpha), None, pygame.BLEND_RGBA_MULT)
+        
+        # Apply scale if needed
+        if pokemon_sprite.scale != 1.0:
+            new_width = int(sprite.get_width() * pokemon_sprite.scale)
+            new_height = int(sprite.get_height() * pokemon_sprite.scale)
+            sprite = pygame.transform.scale(sprite, (new_width, new_height))
+        
+        # Keep only a handful of variants in case alpha or scale are tweened
+        if len(variants) >= 8:
+            variants.clear()
+        variants[key] = sprite
+        return sprite
+    
     def _draw_hp_bar(self, pokemon_sprite, x, y):
         """Draw an HP bar for a Pokémon."""
         if not pokemon_sprite:
             return
             
-        pokemon = pokemon_sprite['pokemon']
+        pokemon = pokemon_sprite.pokemon
         hp_percent = pokemon.current_hp / pokemon.max_hp
         
         # Draw HP bar background
-        pygame.draw.rect(self.screen, DARK_GRAY, (x, y, 200, 20))
+        self._blit_queue.append((self.battle_ui['hp_bar'], (x, y)))
         
         # Determine HP bar color
         if hp_percent > 0.5:
@@ -490,17 +611,17 @@ class BattleGUI:
         
         # Draw HP bar fill
         bar_width = int(196 * hp_percent)
-        pygame.draw.rect(self.screen, color, (x + 2, y + 2, bar_width, 16))
+        self._blit_queue.append((self._hp_bar_fills[color], (x + 2, y + 2), (0, 0, bar_width, 16)))
         
         # Draw HP text
         hp_text = f"HP: {pokemon.current_hp}/{pokemon.max_hp}"
-        text_surface = self.font_small.render(hp_text, True, BLACK)
-        self.screen.blit(text_surface, (x + 10, y + 25))
+        text_surface = self._text(self.font_small, hp_text, BLACK)
+        self._blit_queue.append((text_surface, (x + 10, y + 25)))
         
         # Draw Pokémon name and level
         name_text = f"{pokemon.name} Lv.{pokemon.level}"
-        name_surface = self.font_medium.render(name_text, True, BLACK)
-        self.screen.blit(name_surface, (x, y - 30))
+        name_surface = self._text(self.font_medium, name_text, BLACK)
+        self._blit_queue.append((name_surface, (x, y - 30)))
     
     def _draw_message_box(self):
         """Draw the message box with the current message."""
@@ -508,94 +629,125 @@ class BattleGUI:
             return
             
         # Draw message box background
-        pygame.draw.rect(self.screen, WHITE, (20, SCREEN_HEIGHT - 180, SCREEN_WIDTH - 40, 100))
-        pygame.draw.rect(self.screen, BLACK, (20, SCREEN_HEIGHT - 180, SCREEN_WIDTH - 40, 100), 2)
+        self._flush_blits()
+        self._dirty_rects.append(pygame.draw.rect(self.screen, WHITE, (20, SCREEN_HEIGHT - 180, SCREEN_WIDTH - 40, 100)))
+        self._dirty_rects.append(pygame.draw.rect(self.screen, BLACK, (20, SCREEN_HEIGHT - 180, SCREEN_WIDTH - 40, 100), 2))
         
-        # Draw message text with word wrapping
-        words = self.message.split(' ')
+        # Draw each line of text, wrapped and rendered when the message was set
+        for i, text_surface in enumerate(self._message_line_surfs):
+            self._blit_queue.append((text_surface, (40, SCREEN_HEIGHT - 150 + i * 30)))
+    
+    def _wrap_text(self, text):
+        """Split text into lines that fit in the message box."""
+        words = text.split(' ')
         lines = []
         current_line = []
         
+        # Measure each word once and keep a running line width instead of
+        # re-measuring the whole line for every word. Kerning makes the sum a
+        # few pixels off, so lines close to the limit are measured exactly.
+        max_width = SCREEN_WIDTH - 80
+        space_width = self.font_medium.size(' ')[0]
+        line_width = 0
+        
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = self.font_medium.render(test_line, True, BLACK)
-            if test_surface.get_width() < SCREEN_WIDTH - 80:
+            word_width = self.font_medium.size(word)[0]
+            width = line_width + space_width + word_width if current_line else word_width
+            if width >= max_width - 16:
+                width = self.font_medium.size(' '.join(current_line + [word]))[0]
+            if width < max_width:
                 current_line.append(word)
+                line_width = width
             else:
                 lines.append(' '.join(current_line))
                 current_line = [word]
+                line_width = word_width
         
         if current_line:
             lines.append(' '.join(current_line))
-        
-        # Draw each line of text
-        for i, line in enumerate(lines):
-            text_surface = self.font_medium.render(line, True, BLACK)
-            self.screen.blit(text_surface, (40, SCREEN_HEIGHT - 150 + i * 30))
+        return lines
+    
+    def _text(self, font, text, color):
+        """Render text, reusing the surface from earlier frames when possible."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
     
     def _draw_main_menu(self):
         """Draw the main battle menu."""
         menu_x = SCREEN_WIDTH - 320
         menu_y = SCREEN_HEIGHT - 160
-        
-        # Draw menu background
-        self.screen.blit(self.battle_ui['menu'], (menu_x, menu_y))
+        self._blit_queue.append((self._main_menu_surfaces[self.selected_menu], (menu_x, menu_y)))
+    
+    def _build_main_menu(self, selected):
+        """Compose the main menu panel with the given option highlighted."""
+        menu = self.battle_ui['menu'].copy()
         
         # Draw menu options
         for i, option in enumerate(self.menu_options):
-            x = menu_x + 20 + (i % 2) * 140
-            y = menu_y + 20 + (i // 2) * 60
+            x = 20 + (i % 2) * 140
+            y = 20 + (i // 2) * 60
             
             # Highlight selected option
-            if i == self.selected_menu:
-                self.screen.blit(self.battle_ui['menu_highlight'], (x - 10, y - 10))
+            if i == selected:
+                menu.blit(self.battle_ui['menu_highlight'], (x - 10, y - 10))
             
             # Draw option text
-            text_surface = self.font_medium.render(option, True, BLACK)
-            self.screen.blit(text_surface, (x, y))
+            menu.blit(self.font_medium.render(option, True, BLACK), (x, y))
+        return menu
     
     def _draw_move_menu(self):
         """Draw the move selection menu."""
-        if not self.player_pokemon_sprite or 'pokemon' not in self.player_pokemon_sprite:
+        if not self.player_pokemon_sprite:
             return
             
-        pokemon = self.player_pokemon_sprite['pokemon']
+        pokemon = self.player_pokemon_sprite.pokemon
         if not hasattr(pokemon, 'moves') or not pokemon.moves:
             return
-            
-        menu_x = 20
-        menu_y = SCREEN_HEIGHT - 180
+        
+        # Reuse the composed menu unless the selection or a move's PP changed
+        key = (self.move_menu_index,
+               tuple((move.name, move.pp, move.max_pp) for move in pokemon.moves[:4]))
+        cached = self._move_menu_cache.get(id(pokemon))
+        if cached is None or cached[0] != key:
+            cached = self._move_menu_cache[id(pokemon)] = (key, self._build_move_menu(pokemon))
+        self._blit_queue.append((cached[1], (20, SCREEN_HEIGHT - 180)))
+    
+    def _build_move_menu(self, pokemon):
+        """Compose the move menu for a Pokémon with the current move highlighted."""
         menu_width = SCREEN_WIDTH - 40
         menu_height = 150
         
         # Draw menu background
-        pygame.draw.rect(self.screen, WHITE, (menu_x, menu_y, menu_width, menu_height))
-        pygame.draw.rect(self.screen, BLACK, (menu_x, menu_y, menu_width, menu_height), 2)
+        menu = pygame.Surface((menu_width, menu_height)).convert()
+        menu.fill(WHITE)
+        pygame.draw.rect(menu, BLACK, (0, 0, menu_width, menu_height), 2)
         
         # Draw move list
-        pokemon = self.player_pokemon_sprite['pokemon']
         for i, move in enumerate(pokemon.moves):
             if i >= 4:  # Only show 4 moves max
                 break
                 
             row = i // 2
             col = i % 2
-            x = menu_x + 20 + col * (menu_width // 2)
-            y = menu_y + 20 + row * 60
+            x = 20 + col * (menu_width // 2)
+            y = 20 + row * 60
             
             # Highlight selected move
             if i == self.move_menu_index:
-                pygame.draw.rect(self.screen, (200, 200, 255), (x - 10, y - 10, 360, 50))
+                pygame.draw.rect(menu, (200, 200, 255), (x - 10, y - 10, 360, 50))
             
             # Draw move name and PP
             move_text = f"{move.name}"
             pp_text = f"PP {move.pp}/{move.max_pp}"
             
-            move_surface = self.font_medium.render(move_text, True, BLACK)
-            pp_surface = self.font_small.render(pp_text, True, DARK_GRAY)
-            
-            self.screen.blit(move_surface, (x, y))
-            self.screen.blit(pp_surface, (x, y + 30))
+            menu.blit(self.font_medium.render(move_text, True, BLACK), (x, y))
+            menu.blit(self.font_small.render(pp_text, True, DARK_GRAY), (x, y + 30))
+        return menu
     
     def show_message(self, message: str, duration: float = 3.0):
         """Display a message in the battle UI.
@@ -617,60 +769,61 @@ class BattleGUI:
         damage = 0
         if move.power > 0:
             # Simple damage calculation (can be enhanced with actual formulas)
-            attack = attacker.attack if move.category == MoveCategory.PHYSICAL else attacker.special_attack
-            defense = defender.defense if move.category == MoveCategory.PHYSICAL else defender.special_defense
+            attack = attacker.attack if move.is_physical else attacker.special_attack
+            defense = defender.defense if move.is_physical else defender.special_defense
             damage = max(1, int((attacker.level * 0.4 + 2) * attack * move.power / (defense * 50) + 2))
         
         # Apply damage
-        defender.current_hp = max(0, defender.current_hp - damage)
+        defender.take_damage(damage)
         self.message = f"{attacker.name} used {move.name}! It dealt {damage} damage!"
         
         # Check for fainting
         if defender.is_fainted():
             self.message = f"{defender.name} fainted!"
-            if defender == self.player_pokemon_sprite['pokemon']:
-                self.player_pokemon_sprite['state'] = AnimationState.FAINT
+            if defender == self.player_pokemon_sprite.pokemon:
+                self.player_pokemon_sprite.state = AnimationState.FAINT
             else:
-                self.opponent_pokemon_sprite['state'] = AnimationState.FAINT
+                self.opponent_pokemon_sprite.state = AnimationState.FAINT
     
     def _auto_battle_move(self):
         """Make a random move for auto-battle."""
         if not self.waiting_for_input and not self.show_move_menu:
             # Player's turn
-            if self.player_pokemon_sprite and not self.player_pokemon_sprite['pokemon'].is_fainted():
-                pokemon = self.player_pokemon_sprite['pokemon']
+            if self.player_pokemon_sprite and not self.player_pokemon_sprite.pokemon.is_fainted():
+                pokemon = self.player_pokemon_sprite.pokemon
                 if pokemon.moves:
-                    move = random.choice(pokemon.moves)
+                    move = pokemon.moves[_randrange(len(pokemon.moves))]
                     self.message = f"{pokemon.name} used {move.name}!"
-                    self._execute_move(pokemon, move, self.opponent_pokemon_sprite['pokemon'])
+                    self._execute_move(pokemon, move, self.opponent_pokemon_sprite.pokemon)
             
             # Opponent's turn (if still alive)
             if (self.opponent_pokemon_sprite and 
-                not self.opponent_pokemon_sprite['pokemon'].is_fainted() and
-                not self.player_pokemon_sprite['pokemon'].is_fainted()):
-                pokemon = self.opponent_pokemon_sprite['pokemon']
+                not self.opponent_pokemon_sprite.pokemon.is_fainted() and
+                not self.player_pokemon_sprite.pokemon.is_fainted()):
+                pokemon = self.opponent_pokemon_sprite.pokemon
                 if pokemon.moves:
-                    move = random.choice(pokemon.moves)
+                    move = pokemon.moves[_randrange(len(pokemon.moves))]
                     self.message = f"Opponent's {pokemon.name} used {move.name}!"
-                    self._execute_move(pokemon, move, self.player_pokemon_sprite['pokemon'])
+                    self._execute_move(pokemon, move, self.player_pokemon_sprite.pokemon)
     
     def animate_attack(self, attacker, defender):
         """Animate a Pokémon attack."""
-        if self.player_pokemon_sprite and 'pokemon' in self.player_pokemon_sprite:
-            if attacker == self.player_pokemon_sprite['pokemon']:
-                self.player_pokemon_sprite['state'] = AnimationState.ATTACK
-                self.player_pokemon_sprite['anim_timer'] = 0
-            elif defender == self.player_pokemon_sprite['pokemon']:
-                self.player_pokemon_sprite['state'] = AnimationState.DAMAGE
-                self.player_pokemon_sprite['anim_timer'] = 0
-        
-        if self.opponent_pokemon_sprite and 'pokemon' in self.opponent_pokemon_sprite:
-            if attacker == self.opponent_pokemon_sprite['pokemon']:
-                self.opponent_pokemon_sprite['state'] = AnimationState.ATTACK
-                self.opponent_pokemon_sprite['anim_timer'] = 0
-            elif defender == self.opponent_pokemon_sprite['pokemon']:
-                self.opponent_pokemon_sprite['state'] = AnimationState.DAMAGE
-                self.opponent_pokemon_sprite['anim_timer'] = 0
+        self._animating = True
+        if self.player_pokemon_sprite:
+            if attacker == self.player_pokemon_sprite.pokemon:
+                self.player_pokemon_sprite.state = AnimationState.ATTACK
+                self.player_pokemon_sprite.anim_timer = 0
+            elif defender == self.player_pokemon_sprite.pokemon:
+                self.player_pokemon_sprite.state = AnimationState.DAMAGE
+                self.player_pokemon_sprite.anim_timer = 0
+        
+        if self.opponent_pokemon_sprite:
+            if attacker == self.opponent_pokemon_sprite.pokemon:
+                self.opponent_pokemon_sprite.state = AnimationState.ATTACK
+                self.opponent_pokemon_sprite.anim_timer = 0
+            elif defender == self.opponent_pokemon_sprite.pokemon:
+                self.opponent_pokemon_sprite.state = AnimationState.DAMAGE
+                self.opponent_pokemon_sprite.anim_timer = 0
 
 class BattleGUIWrapper:
     """Wrapper class to integrate with the existing battle system."""
@@ -5,28 +5,118 @@ Handles loading and caching of Pokémon sprites from PokeAPI.
 """
 
 import os
+import struct
+import sys
+import tempfile
+import threading
 import pygame
 import requests
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 from io import BytesIO
 from urllib.parse import urljoin
 
+# Character substitutions turning a Pokémon's name into its API name
+_NAME_TRANSLATION = str.maketrans({'♀': '-f', '♂': '-m', ' ': '-', '.': None, ':': None})
+
+# Special cases for Pokémon with different names in the API
+_SPECIAL_NAMES = {
+    'nidoranf': 'nidoran-f',
+    'nidoranm': 'nidoran-m',
+    'farfetchd': 'farfetchd',
+    'mrmime': 'mr-mime',
+    'mimejr': 'mime-jr',
+    'typenull': 'type-null',
+    'tapu-koko': 'tapu-koko',
+    'tapu-lele': 'tapu-lele',
+    'tapu-bulu': 'tapu-bulu',
+    'tapu-fini': 'tapu-fini',
+    'mr-rime': 'mr-rime',
+    'sirfetchd': 'sirfetchd',
+    'mr-mime-galar': 'mr-mime-galar',
+    'mr-rime-galar': 'mr-rime-galar'
+}
+
+# Header of raw cache files: width, height and pixel layout (index into _RAW_FORMATS)
+_RAW_HEADER = struct.Struct('<III')
+# Pixel layouts of raw cache files; the first two keep older RGB/RGBA files readable
+_RAW_FORMATS = ('RGB', 'RGBA', 'BGRA', 'ARGB')
+
+# Byte layout of 32-bit alpha surfaces by their channel masks (little-endian
+# only), so pixels can be stored in the same order the display uses
+_ALPHA_LAYOUTS = {
+    (0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000): 'RGBA',
+    (0x00ff0000, 0x0000ff00, 0x000000ff, 0xff000000): 'BGRA',
+    (0x0000ff00, 0x00ff0000, 0xff000000, 0x000000ff): 'ARGB',
+} if sys.byteorder == 'little' else {}
+
+# Per-sprite locks shared by all managers, so a sprite is only ever loaded or
+# downloaded by one thread at a time. Each entry is [lock, number of threads
+# holding or waiting for it] and is dropped when that reaches zero, so only
+# sprites currently being loaded have one.
+_KEY_LOCKS: Dict[str, list] = {}
+_KEY_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def _key_lock(cache_key: str) -> Iterator[None]:
+    """Hold the lock serializing loads of one sprite."""
+    with _KEY_LOCKS_GUARD:
+        entry = _KEY_LOCKS.get(cache_key)
+        if entry is None:
+            entry = _KEY_LOCKS[cache_key] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _KEY_LOCKS_GUARD:
+            entry[1] -= 1
+            if not entry[1]:
+                del _KEY_LOCKS[cache_key]
+
 class SpriteManager:
-    """Manages loading and caching of Pokémon sprites from PokeAPI."""
+    """Manages loading and caching of Pokémon sprites from PokeAPI.
+    
+    Sprites are cached on disk as raw pixel data rather than PNG, so loading
+    a cached sprite is a copy instead of a decode. PNG files from older
+    caches are still read and converted on first use.
+    """
     
     BASE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/"
     CACHE_DIR = Path("pokemon_sprites_cache")
+    PREFETCH_WORKERS = 8
     
-    def __init__(self):
-        """Initialize the sprite manager."""
-        self.cache: Dict[str, pygame.Surface] = {}
+    def __init__(self, capacity: int = 128):
+        """Initialize the sprite manager.
+        
+        Args:
+            capacity: Number of sprites kept in memory; the least recently used
+                are dropped beyond that (they stay in the disk cache)
+        """
+        self.capacity = capacity
+        self.cache: OrderedDict[str, pygame.Surface] = OrderedDict()
+        # Scaled copies of cached sprites by (max_size, smooth), dropped along
+        # with their original when it is evicted
+        self._scaled_cache: Dict[str, Dict[Tuple[int, bool], pygame.Surface]] = {}
+        self._cache_lock = threading.Lock()  # prefetch() fills the cache from several threads
+        # One session for all downloads, so the connection to the sprite
+        # host is reused instead of re-established for every sprite
+        self._session = requests.Session()
+        self._display_alpha_layout: Optional[str] = None  # found on first raw load
         self._setup_cache_dir()
     
     def _setup_cache_dir(self):
-        """Create cache directory if it doesn't exist."""
+        """Create cache directory if it doesn't exist and list its files."""
         if not self.CACHE_DIR.exists():
             self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Snapshot of the cached file names, kept up to date by _save_raw, so
+        # lookups don't stat the disk for every sprite
+        with os.scandir(self.CACHE_DIR) as entries:
+            self._on_disk = {entry.name for entry in entries}
     
     def get_pokemon_sprite(self, pokemon_name: str, sprite_type: str = "front_default") -> Optional[pygame.Surface]:
         """
@@ -39,56 +129,185 @@ class SpriteManager:
         Returns:
             pygame.Surface with the sprite or None if loading failed
         """
-        # Handle Pokémon with special names and forms
-        pokemon_name = str(pokemon_name).lower()
-        pokemon_name = pokemon_name.replace('♀', '-f')
-        pokemon_name = pokemon_name.replace('♂', '-m')
-        pokemon_name = pokemon_name.replace(' ', '-')
-        pokemon_name = pokemon_name.replace('.', '')
-        pokemon_name = pokemon_name.replace(':', '')
-        
-        # Special cases for Pokémon with different names in the API
-        special_names = {
-            'nidoranf': 'nidoran-f',
-            'nidoranm': 'nidoran-m',
-            'farfetchd': 'farfetchd',
-            'mrmime': 'mr-mime',
-            'mimejr': 'mime-jr',
-            'typenull': 'type-null',
-            'tapu-koko': 'tapu-koko',
-            'tapu-lele': 'tapu-lele',
-            'tapu-bulu': 'tapu-bulu',
-            'tapu-fini': 'tapu-fini',
-            'mr-rime': 'mr-rime',
-            'sirfetchd': 'sirfetchd',
-            'mr-mime-galar': 'mr-mime-galar',
-            'mr-rime-galar': 'mr-rime-galar'
-        }
-        
-        pokemon_name = special_names.get(pokemon_name, pokemon_name)
+        pokemon_name = self._api_name(pokemon_name)
         cache_key = f"{pokemon_name}_{sprite_type}"
         
         # Return from cache if available
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        surface = self._cache_get(cache_key)
+        if surface is not None:
+            return surface
         
+        # Threads asking for a sprite that is already being loaded wait for
+        # that load and then find the sprite cached instead of repeating it
+        with _key_lock(cache_key):
+            surface = self._cache_get(cache_key)
+            if surface is not None:
+                return surface
+            return self._load_pokemon_sprite(pokemon_name, sprite_type, cache_key)
+    
+    def _load_pokemon_sprite(self, pokemon_name: str, sprite_type: str,
+                             cache_key: str) -> Optional[pygame.Surface]:
+        """
+        Load a sprite missing from memory from the disk cache or PokeAPI.
+        
+        Args:
+            pokemon_name: Name of the Pokémon as PokeAPI spells it
+            sprite_type: Type of sprite to get
+            cache_key: Key to use for caching
+            
+        Returns:
+            pygame.Surface with the sprite or None if loading failed
+        """
         # Try to load from cache file
-        cache_file = self.CACHE_DIR / f"{cache_key}.png"
-        if cache_file.exists():
+        cache_file = self.CACHE_DIR / f"{cache_key}.raw"
+        if self._is_on_disk(cache_file):
             try:
-                surface = pygame.image.load(str(cache_file))
+                surface = self._load_raw(cache_file)
+                self._cache_put(cache_key, surface)
+                return surface
+            except (OSError, ValueError, struct.error, pygame.error) as e:
+                print(f"Error loading cached sprite {cache_file}: {e}")
+        
+        # Fall back to a PNG from an older cache, storing it raw for next time
+        png_file = cache_file.with_suffix('.png')
+        if self._is_on_disk(png_file):
+            try:
+                surface = pygame.image.load(str(png_file))
                 if surface.get_alpha():
                     surface = surface.convert_alpha()
                 else:
                     surface = surface.convert()
-                self.cache[cache_key] = surface
+                self._cache_put(cache_key, surface)
+                self._save_raw(surface, cache_file)
                 return surface
             except pygame.error as e:
-                print(f"Error loading cached sprite {cache_file}: {e}")
+                print(f"Error loading cached sprite {png_file}: {e}")
         
         # Download the sprite
         return self._download_pokemon_sprite(pokemon_name, sprite_type, cache_key, cache_file)
     
+    def get_scaled_sprite(self, pokemon_name: str, max_size: int,
+                          sprite_type: str = "front_default",
+                          smooth: bool = True) -> Optional[pygame.Surface]:
+        """
+        Get a Pokémon sprite scaled to fit within max_size, scaling it only once.
+        
+        Args:
+            pokemon_name: Name of the Pokémon
+            max_size: Maximum width/height of the scaled sprite
+            sprite_type: Type of sprite to get (front_default, front_shiny, etc.)
+            smooth: Passed on to scale_sprite
+            
+        Returns:
+            Scaled pygame.Surface or None if loading failed
+        """
+        sprite = self.get_pokemon_sprite(pokemon_name, sprite_type)
+        if sprite is None:
+            return None
+        
+        cache_key = f"{self._api_name(pokemon_name)}_{sprite_type}"
+        size_key = (max_size, smooth)
+        with self._cache_lock:
+            scaled = self._scaled_cache.get(cache_key, {}).get(size_key)
+        if scaled is None:
+            scaled = self.scale_sprite(sprite, max_size, smooth)
+            with self._cache_lock:
+                # Skip storing if the original was evicted in the meantime
+                if cache_key in self.cache:
+                    self._scaled_cache.setdefault(cache_key, {})[size_key] = scaled
+        return scaled
+    
+    @staticmethod
+    def _api_name(pokemon_name: str) -> str:
+        """Convert a Pokémon's name to the name PokeAPI uses for it."""
+        # Handle Pokémon with special names and forms
+        pokemon_name = str(pokemon_name).lower().translate(_NAME_TRANSLATION)
+        return _SPECIAL_NAMES.get(pokemon_name, pokemon_name)
+    
+    def _is_on_disk(self, cache_file: Path) -> bool:
+        """
+        Check whether a file is in the disk cache.
+        
+        Names missing from the snapshot are checked on disk once, since
+        another sprite manager may have written them since it was taken.
+        
+        Args:
+            cache_file: Path to cache file
+            
+        Returns:
+            True if the file exists
+        """
+        if cache_file.name in self._on_disk:
+            return True
+        if cache_file.exists():
+            self._on_disk.add(cache_file.name)
+            return True
+        return False
+    
+    def _cache_get(self, cache_key: str) -> Optional[pygame.Surface]:
+        """Get a sprite from the in-memory cache, marking it recently used."""
+        with self._cache_lock:
+            surface = self.cache.get(cache_key)
+            if surface is not None:
+                self.cache.move_to_end(cache_key)
+            return surface
+    
+    def _cache_put(self, cache_key: str, surface: pygame.Surface):
+        """Add a sprite to the in-memory cache, evicting the least recently used."""
+        with self._cache_lock:
+            self.cache[cache_key] = surface
+            self.cache.move_to_end(cache_key)
+            if len(self.cache) > self.capacity:
+                evicted_key, _ = self.cache.popitem(last=False)
+                self._scaled_cache.pop(evicted_key, None)
+    
+    def prefetch(self, pokemon_names: Iterable[str],
+                 sprite_type: str = "front_default") -> List[Optional[pygame.Surface]]:
+        """
+        Load several Pokémon sprites at once, downloading missing ones concurrently.
+        
+        Args:
+            pokemon_names: Names of the Pokémon
+            sprite_type: Type of sprite to get (front_default, front_shiny, etc.)
+            
+        Returns:
+            The sprites in the same order as the names (None where loading failed)
+        """
+        return [future.result() for future in self.prefetch_async(pokemon_names, sprite_type)]
+    
+    def prefetch_async(self, pokemon_names: Iterable[str],
+                       sprite_type: str = "front_default") -> List[Future]:
+        """
+        Start loading several Pokémon sprites in the background and return at once.
+        
+        Before the display is set up, sprites can't be converted to its
+        format yet, so only the disk cache is filled and the futures resolve
+        to None; loading the sprites later is then a local read.
+        
+        Args:
+            pokemon_names: Names of the Pokémon
+            sprite_type: Type of sprite to get (front_default, front_shiny, etc.)
+            
+        Returns:
+            One future per name, resolving to the sprite (or None)
+        """
+        return [_EXECUTOR.submit(self._prefetch_one, name, sprite_type) for name in pokemon_names]
+    
+    def _prefetch_one(self, pokemon_name: str, sprite_type: str) -> Optional[pygame.Surface]:
+        """Load one sprite for prefetch_async, or only download it if there's no display yet."""
+        if pygame.display.get_surface() is not None:
+            return self.get_pokemon_sprite(pokemon_name, sprite_type)
+        
+        pokemon_name = self._api_name(pokemon_name)
+        cache_key = f"{pokemon_name}_{sprite_type}"
+        cache_file = self.CACHE_DIR / f"{cache_key}.raw"
+        with _key_lock(cache_key):
+            if not self._is_on_disk(cache_file) and not self._is_on_disk(cache_file.with_suffix('.png')):
+                surface = self._fetch_sprite(pokemon_name, sprite_type)
+                if surface is not None:
+                    self._save_raw(surface, cache_file)
+        return None
+    
     def _download_pokemon_sprite(self, pokemon_name: str, sprite_type: str, 
                                cache_key: str, cache_file: Path) -> Optional[pygame.Surface]:
         """
@@ -100,6 +319,39 @@ class SpriteManager:
             cache_key: Key to use for caching
             cache_file: Path to cache file
             
+        Returns:
+            pygame.Surface with the sprite or None if download failed
+        """
+        surface = self._fetch_sprite(pokemon_name, sprite_type)
+        if surface is None:
+            return None
+        
+        try:
+            # Convert to optimal format
+            if surface.get_alpha():
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+        except pygame.error as e:
+            print(f"Failed to convert sprite {cache_key}: {e}")
+            return None
+        
+        # Cache the surface
+        self._cache_put(cache_key, surface)
+        
+        # Save to cache file
+        self._save_raw(surface, cache_file)
+        
+        return surface
+    
+    def _fetch_sprite(self, pokemon_name: str, sprite_type: str) -> Optional[pygame.Surface]:
+        """
+        Download and decode a Pokémon sprite without converting or caching it.
+        
+        Args:
+            pokemon_name: Name of the Pokémon (lowercase)
+            sprite_type: Type of sprite to get
+            
         Returns:
             pygame.Surface with the sprite or None if download failed
         """
@@ -119,29 +371,12 @@ class SpriteManager:
         print(f"Downloading sprite from {url}")
         
         try:
-            response = requests.get(url, stream=True, timeout=10)
+            response = self._session.get(url, stream=True, timeout=10)
             response.raise_for_status()
             
             # Load image data into pygame
             image_data = BytesIO(response.content)
-            surface = pygame.image.load(image_data)
-            
-            # Convert to optimal format
-            if surface.get_alpha():
-                surface = surface.convert_alpha()
-            else:
-                surface = surface.convert()
-            
-            # Cache the surface
-            self.cache[cache_key] = surface
-            
-            # Save to cache file
-            try:
-                pygame.image.save(surface, str(cache_file))
-            except Exception as e:
-                print(f"Error saving sprite to cache {cache_file}: {e}")
-            
-            return surface
+            return pygame.image.load(image_data)
             
         except requests.RequestException as e:
             print(f"Failed to download sprite {url}: {e}")
@@ -150,13 +385,88 @@ class SpriteManager:
             print(f"Failed to load image data from {url}: {e}")
             return None
     
-    def scale_sprite(self, sprite: pygame.Surface, max_size: int) -> pygame.Surface:
+    def _save_raw(self, surface: pygame.Surface, cache_file: Path):
+        """
+        Write a sprite's pixels to a raw cache file.
+        
+        The file is written under a temporary name unique to this call and
+        then moved into place, so a concurrent reader never sees a partly
+        written one.
+        
+        Args:
+            surface: The sprite to save
+            cache_file: Path to cache file
+        """
+        # Alpha sprites are written in their own channel order, which after
+        # conversion is the display's, so loading them needs no conversion
+        if surface.get_alpha():
+            layout = _ALPHA_LAYOUTS.get(surface.get_masks(), 'RGBA')
+        else:
+            layout = 'RGB'
+        width, height = surface.get_size()
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=cache_file.parent, prefix=cache_file.stem,
+                                             suffix='.tmp', delete=False) as f:
+                tmp_name = f.name
+                f.write(_RAW_HEADER.pack(width, height, _RAW_FORMATS.index(layout)))
+                f.write(pygame.image.tobytes(surface, layout))
+            os.replace(tmp_name, cache_file)
+            self._on_disk.add(cache_file.name)
+        except (OSError, pygame.error) as e:
+            print(f"Error saving sprite to cache {cache_file}: {e}")
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+    
+    def _load_raw(self, cache_file: Path) -> pygame.Surface:
+        """
+        Load a sprite saved by _save_raw.
+        
+        Args:
+            cache_file: Path to cache file
+            
+        Returns:
+            pygame.Surface with the sprite, converted to the display format
+        """
+        data = bytearray(cache_file.stat().st_size)
+        with open(cache_file, 'rb') as f:
+            f.readinto(data)
+        width, height, layout_index = _RAW_HEADER.unpack_from(data)
+        if layout_index >= len(_RAW_FORMATS):
+            raise ValueError(f"Unknown pixel layout {layout_index}")
+        layout = _RAW_FORMATS[layout_index]
+        surface = pygame.image.frombuffer(memoryview(data)[_RAW_HEADER.size:], (width, height), layout)
+        if layout == 'RGB':
+            return surface.convert()
+        if layout == self._get_display_alpha_layout():
+            # Already in the display's format; the surface keeps data alive
+            return surface
+        return surface.convert_alpha()
+    
+    def _get_display_alpha_layout(self) -> str:
+        """
+        Get the byte layout convert_alpha() produces for the current display.
+        
+        Returns:
+            A _RAW_FORMATS layout name, or '' if it isn't one of them
+        """
+        if self._display_alpha_layout is None:
+            probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            self._display_alpha_layout = _ALPHA_LAYOUTS.get(probe.get_masks(), '')
+        return self._display_alpha_layout
+    
+    def scale_sprite(self, sprite: pygame.Surface, max_size: int, smooth: bool = True) -> pygame.Surface:
         """
         Scale a sprite to fit within a maximum size while maintaining aspect ratio.
         
         Args:
             sprite: The sprite to scale
             max_size: Maximum width/height of the scaled sprite
+            smooth: Filter the result with smoothscale; pass False for the much
+                faster nearest-neighbour scale where blocky pixels are fine
             
         Returns:
             Scaled pygame.Surface
@@ -171,4 +481,11 @@ class SpriteManager:
         ratio = min(max_size / width, max_size / height)
         new_width = int(width * ratio)
         new_height = int(height * ratio)
-        return pygame.transform.smoothscale(sprite, (new_width, new_height))
+        # smoothscale only handles 24 and 32-bit surfaces
+        if smooth and sprite.get_bitsize() >= 24:
+            return pygame.transform.smoothscale(sprite, (new_width, new_height))
+        return pygame.transform.scale(sprite, (new_width, new_height))
+
+
+# Shared by all sprite managers for background loading
+_EXECUTOR = ThreadPoolExecutor(max_workers=SpriteManager.PREFETCH_WORKERS)
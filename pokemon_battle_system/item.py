@@ -2,7 +2,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, Callable, Dict, Any, List
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """Represents a held item that a Pokémon can have.
     
@@ -73,7 +73,7 @@ LIFE_ORB = create_item(
 CHOICE_BAND = create_item(
     name="Choice Band",
     description="Boosts the power of physical moves by 50%, but restricts the user to one move.",
-    on_before_move=lambda battle, pokemon, move: battle.boost_stat(pokemon, 'attack', 1) if move.category == 'Physical' else None
+    on_before_move=lambda battle, pokemon, move: battle.boost_stat(pokemon, 'attack', 1) if move.is_physical else None
 )
 
 FOCUS_SASH = create_item(
@@ -1,9 +1,14 @@
 """Move class for Pokémon battle system."""
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Any
-from .enums import MoveCategory
+from typing import TYPE_CHECKING, Dict, Optional, List, Any
+from .enums import MoveCategory, MoveFlags
+from .type_chart import TYPE_CHART, type_bit, type_id
 
-@dataclass
+if TYPE_CHECKING:
+    from .pokemon import Pokemon
+
+@dataclass(slots=True)
 class Move:
     """Represents a move that a Pokémon can use in battle.
     
@@ -19,6 +24,13 @@ class Move:
         effect (dict, optional): Additional effects of the move
         target (str): Target of the move ('normal', 'self', 'allAdjacentFoes', etc.)
         flags (Dict[str, bool]): Additional flags for the move
+        type_id (int): Type chart index of the move's type (-1 if unknown)
+        type_bit (int): ``1 << type_id``, or 0 if the type is unknown
+        flag_bits (MoveFlags): The set entries of ``flags`` packed as bit flags
+        effect_chance (float): Chance that the move's effect triggers (0-1)
+        type_lower (str): The move's type in lowercase
+        is_physical (bool): Whether the move is in the Physical category
+        is_status (bool): Whether the move is in the Status category
     """
     name: str
     type: str
@@ -31,11 +43,57 @@ class Move:
     effect: Optional[dict] = None
     target: str = "normal"
     flags: Dict[str, bool] = field(default_factory=dict)
+    type_id: int = field(default=-1, init=False, repr=False, compare=False)
+    type_bit: int = field(default=0, init=False, repr=False, compare=False)
+    flag_bits: MoveFlags = field(default=MoveFlags.NONE, init=False, repr=False, compare=False)
+    effect_chance: float = field(default=1.0, init=False, repr=False, compare=False)
+    type_lower: str = field(default="", init=False, repr=False, compare=False)
+    is_physical: bool = field(default=False, init=False, repr=False, compare=False)
+    is_status: bool = field(default=False, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize the move with default values."""
         if self.pp > self.max_pp:
             self.pp = self.max_pp
+        self.type_id = type_id(self.type)
+        self.type_bit = type_bit(self.type_id)
+        
+        # Only PP changes after creation, so derive the values battles test per hit once
+        self.type_lower = self.type.lower()
+        self.is_physical = self.category == MoveCategory.PHYSICAL
+        self.is_status = self.category == MoveCategory.STATUS
+        
+        # Translate the flags dict and effect chance once so battles can test them cheaply
+        flag_bits = MoveFlags.NONE
+        for name, enabled in self.flags.items():
+            flag = MoveFlags.__members__.get(name.upper())
+            if enabled and flag is not None:
+                flag_bits |= flag
+        self.flag_bits = flag_bits
+        if self.effect:
+            self.effect_chance = self.effect.get('chance', 1.0)
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Move':
+        """Copy the move for a copied party.
+        
+        Only PP changes during a battle and the effect and flags dicts are
+        never mutated, so the copy references the original's dicts rather
+        than deep-copying them. Each copy is still a separate Move with its
+        own PP.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        for klass in cls.__mro__:
+            slots = getattr(klass, '__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    # Move's own fields are shared; state added by subclasses is copied
+                    value = getattr(self, name)
+                    object.__setattr__(clone, name, value if klass is Move else deepcopy(value, memo))
+        if hasattr(self, '__dict__'):
+            clone.__dict__.update(deepcopy(self.__dict__, memo))
+        return clone
     
     def use(self) -> bool:
         """Use the move, consuming PP.
@@ -68,9 +126,15 @@ class Move:
         Returns:
             float: Effectiveness multiplier (0, 0.25, 0.5, 1, 2, or 4)
         """
-        # This would be implemented with the type chart
-        # For now, return neutral damage
-        return 1.0
+        if self.type_id < 0:
+            return 1.0
+        row = TYPE_CHART[self.type_id]
+        effectiveness = 1.0
+        for target_type in target_types:
+            target_id = type_id(target_type)
+            if target_id >= 0:
+                effectiveness *= row[target_id]
+        return effectiveness
     
     def is_super_effective(self, target_types: List[str]) -> bool:
         """Check if the move is super effective against the target types."""
@@ -84,16 +148,19 @@ class Move:
         """Check if the move has no effect on the target types."""
         return self.get_effectiveness(target_types) == 0
     
-    def get_stab_multiplier(self, user_types: List[str]) -> float:
+    def get_stab_multiplier(self, user: 'Pokemon') -> float:
         """Calculate the STAB (Same Type Attack Bonus) multiplier.
         
         Args:
-            user_types (List[str]): The types of the using Pokémon
+            user (Pokemon): The Pokémon using the move
             
         Returns:
             float: 1.5 if the move matches one of the user's types, 1.0 otherwise
         """
-        return 1.5 if self.type.lower() in [t.lower() for t in user_types] else 1.0
+        if self.type_bit:
+            return 1.5 if user.type_mask & self.type_bit else 1.0
+        # Types outside the type chart have no bit, so compare them by name
+        return 1.5 if user.has_type(self.type_lower) else 1.0
     
     def __str__(self) -> str:
         """Return a string representation of the move."""
@@ -1,14 +1,49 @@
 """Pokémon class for battle system."""
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Any
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Optional, Set, Any, Callable, Tuple
 import random
 
 from .enums import StatusCondition, VolatileStatus, MoveCategory
 from .move import Move
 from .ability import Ability
 from .item import Item
+from .type_chart import type_bit, type_id
 
-@dataclass
+# Stats that have battle stages, in the order stat_stages lists them
+STAT_STAGE_NAMES = ('attack', 'defense', 'special_attack', 'special_defense',
+                    'speed', 'accuracy', 'evasion')
+_ZERO_STAT_STAGES = MappingProxyType(dict.fromkeys(STAT_STAGE_NAMES, 0))
+
+# Links to the Pokémon's trainer and battle that a copy must not carry over
+_DETACHED_ON_COPY = frozenset({'_trainer', 'on_faint', 'on_revive'})
+
+@lru_cache(maxsize=2048)
+def _render_hp_bar(current_hp: int, max_hp: int, width: int) -> str:
+    """Render the text HP bar used by Pokemon.get_hp_bar.
+    
+    The bar depends only on these three values and HP changes far less often
+    than the bar is printed, so rendered bars are memoized.
+    """
+    if max_hp <= 0:
+        return "[DEAD]"
+    
+    hp_percent = current_hp / max_hp
+    filled = int(hp_percent * width)
+    bar = '█' * filled + ' ' * (width - filled)
+    
+    if hp_percent > 0.5:
+        color = "\033[92m"  # Green
+    elif hp_percent > 0.2:
+        color = "\033[93m"  # Yellow
+    else:
+        color = "\033[91m"  # Red
+    
+    return f"[{color}{bar}\033[0m] {current_hp}/{max_hp} ({hp_percent:.1%})"
+
+@dataclass(slots=True)
 class Pokemon:
     """Represents a Pokémon in battle.
     
@@ -27,10 +62,16 @@ class Pokemon:
         ability (Ability, optional): The Pokémon's ability
         item (Item, optional): The Pokémon's held item
         status (StatusCondition, optional): Current status condition
-        volatile_status (Set[VolatileStatus]): Current volatile status conditions
+        volatile_status (int): Bitmask of the current VolatileStatus flags
         stat_stages (Dict[str, int]): Current stat stages (-6 to +6)
         current_hp (int): Current HP
         max_hp (int): Maximum HP (calculated from base stats and level)
+        primary_type_id (int): Type chart index of the primary type (-1 if unknown)
+        secondary_type_id (int): Type chart index of the secondary type (-1 if none)
+        type_mask (int): Bitmask with bit ``type_id`` set for each of the Pokémon's types
+        on_faint (callable, optional): Called with the Pokémon when damage makes it faint
+        on_revive (callable, optional): Called with the Pokémon when healing revives it
+        toxic_counter (int): Turns of Toxic damage taken so far, for its escalating damage
     """
     name: str
     level: int = 50
@@ -46,28 +87,59 @@ class Pokemon:
     ability: Optional[Ability] = None
     item: Optional[Item] = None
     status: Optional[StatusCondition] = StatusCondition.NONE
-    volatile_status: Set[VolatileStatus] = field(default_factory=set)
+    volatile_status: int = 0
     stat_stages: Dict[str, int] = field(default_factory=dict)
     current_hp: int = 0
     max_hp: int = 0
+    primary_type_id: int = field(default=-1, init=False, repr=False, compare=False)
+    secondary_type_id: int = field(default=-1, init=False, repr=False, compare=False)
+    type_mask: int = field(default=0, init=False, repr=False, compare=False)
+    on_faint: Optional[Callable[['Pokemon'], None]] = field(default=None, init=False, repr=False, compare=False)
+    on_revive: Optional[Callable[['Pokemon'], None]] = field(default=None, init=False, repr=False, compare=False)
+    toxic_counter: int = field(default=0, init=False, repr=False, compare=False)
+    _stat_cache: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _types: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _types_lower: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _move_index: Dict[str, Move] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _move_index_source: Tuple[Optional[List[Move]], int] = field(default=(None, 0), init=False, repr=False, compare=False)
+    _trainer: Optional[Any] = field(default=None, init=False, repr=False, compare=False)  # Trainer whose party holds it
     
     def __post_init__(self):
         """Initialize calculated fields."""
+        # Resolve types to type chart indices once
+        self.primary_type_id = type_id(self.primary_type)
+        self.secondary_type_id = type_id(self.secondary_type)
+        self.type_mask = type_bit(self.primary_type_id) | type_bit(self.secondary_type_id)
+        
+        # Types don't change in battle, so freeze them (and their lowercase forms) once
+        self._types = (self.primary_type, self.secondary_type) if self.secondary_type else (self.primary_type,)
+        self._types_lower = tuple(t.lower() for t in self._types)
+        
         # Calculate max HP using standard formula: ((2 * base + IV + (EV/4)) * level / 100) + level + 10
         # For simplicity, we'll assume perfect IVs and no EVs for now
         self.max_hp = ((2 * self.hp) * self.level // 100) + self.level + 10
         self.current_hp = self.max_hp
         
         # Initialize stat stages
-        self.stat_stages = {
-            'attack': 0,
-            'defense': 0,
-            'special_attack': 0,
-            'special_defense': 0,
-            'speed': 0,
-            'accuracy': 0,
-            'evasion': 0
-        }
+        self.stat_stages = dict.fromkeys(STAT_STAGE_NAMES, 0)
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Pokemon':
+        """Copy the Pokémon on its own, without its trainer or battle.
+        
+        Following the trainer back-reference or the battle's faint/revive
+        hooks would clone the whole trainer or battle along with it (and fail
+        on a trainer's sprite manager), so the copy starts out unowned and
+        outside any battle.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        for f in fields(self):
+            value = None if f.name in _DETACHED_ON_COPY else deepcopy(getattr(self, f.name), memo)
+            object.__setattr__(clone, f.name, value)
+        if hasattr(self, '__dict__'):
+            clone.__dict__.update(deepcopy(self.__dict__, memo))
+        return clone
     
     def get_stat(self, stat_name: str) -> int:
         """Get the current value of a stat, considering stat stages.
@@ -80,13 +152,13 @@ class Pokemon:
         """
         if stat_name == 'hp':
             return self.current_hp
+        
+        cached = self._stat_cache.get(stat_name)
+        if cached is not None:
+            return cached
             
         # Get base stat
         base_stat = getattr(self, stat_name, 0)
-        
-        # For HP, just return current HP
-        if stat_name == 'hp':
-            return self.current_hp
             
         # Calculate stat using standard formula: ((2 * base + IV + (EV/4)) * level / 100 + 5) * nature
         # For simplicity, we'll assume neutral nature and perfect IVs/EVs for now
@@ -99,7 +171,17 @@ class Pokemon:
         elif stage < 0:
             stat_value = stat_value * 2 // (2 - stage)
             
-        return max(1, stat_value)  # Stats can't go below 1
+        stat_value = max(1, stat_value)  # Stats can't go below 1
+        self._stat_cache[stat_name] = stat_value
+        return stat_value
+    
+    def clear_stat_cache(self) -> None:
+        """Forget the stat values memoized by get_stat.
+        
+        Called automatically when stat stages change; call it directly after
+        changing base stats or level by hand.
+        """
+        self._stat_cache.clear()
     
     def take_damage(self, amount: int) -> None:
         """Reduce the Pokémon's HP by the given amount.
@@ -107,7 +189,13 @@ class Pokemon:
         Args:
             amount (int): Amount of damage to take
         """
+        was_standing = self.current_hp > 0
         self.current_hp = max(0, min(self.current_hp - amount, self.max_hp))
+        if was_standing and self.current_hp == 0:
+            if self._trainer is not None:
+                self._trainer._alive_count -= 1
+            if self.on_faint is not None:
+                self.on_faint(self)
     
     def heal(self, amount: int) -> int:
         """Heal the Pokémon by the given amount.
@@ -120,6 +208,11 @@ class Pokemon:
         """
         old_hp = self.current_hp
         self.current_hp = min(self.max_hp, self.current_hp + amount)
+        if old_hp <= 0 < self.current_hp:
+            if self._trainer is not None:
+                self._trainer._alive_count += 1
+            if self.on_revive is not None:
+                self.on_revive(self)
         return self.current_hp - old_hp
     
     def is_fainted(self) -> bool:
@@ -139,19 +232,15 @@ class Pokemon:
         Returns:
             bool: True if the Pokémon has the type, False otherwise
         """
-        return (self.primary_type.lower() == type_name.lower() or 
-                (self.secondary_type and self.secondary_type.lower() == type_name.lower()))
+        return type_name.lower() in self._types_lower
     
-    def get_types(self) -> List[str]:
-        """Get a list of the Pokémon's types.
+    def get_types(self) -> Tuple[str, ...]:
+        """Get the Pokémon's types.
         
         Returns:
-            List[str]: List of type names
+            Tuple[str, ...]: Type names, primary type first
         """
-        types = [self.primary_type]
-        if self.secondary_type:
-            types.append(self.secondary_type)
-        return types
+        return self._types
     
     def add_volatile_status(self, status: VolatileStatus) -> bool:
         """Add a volatile status condition.
@@ -162,8 +251,8 @@ class Pokemon:
         Returns:
             bool: True if the status was added, False if already had it
         """
-        if status not in self.volatile_status:
-            self.volatile_status.add(status)
+        if not self.volatile_status & status:
+            self.volatile_status |= status
             return True
         return False
     
@@ -176,8 +265,8 @@ class Pokemon:
         Returns:
             bool: True if the status was removed, False if not present
         """
-        if status in self.volatile_status:
-            self.volatile_status.remove(status)
+        if self.volatile_status & status:
+            self.volatile_status &= ~status
             return True
         return False
     
@@ -190,7 +279,16 @@ class Pokemon:
         Returns:
             bool: True if the Pokémon has the status, False otherwise
         """
-        return status in self.volatile_status
+        return bool(self.volatile_status & status)
+    
+    def get_volatile_statuses(self) -> List[VolatileStatus]:
+        """Get the Pokémon's volatile statuses.
+        
+        Returns:
+            List[VolatileStatus]: The individual flags set in ``volatile_status``
+        """
+        mask = self.volatile_status
+        return [status for status in VolatileStatus if mask & status]
     
     def modify_stat_stage(self, stat: str, amount: int) -> int:
         """Modify a stat stage.
@@ -202,17 +300,20 @@ class Pokemon:
         Returns:
             int: The new stat stage
         """
-        if stat not in self.stat_stages:
+        stage = self.stat_stages.get(stat)
+        if stage is None:
             raise ValueError(f"Invalid stat: {stat}")
             
-        new_stage = max(-6, min(6, self.stat_stages[stat] + amount))
+        new_stage = max(-6, min(6, stage + amount))
         self.stat_stages[stat] = new_stage
+        # Only this stat's memoized value depends on its stage
+        self._stat_cache.pop(stat, None)
         return new_stage
     
     def reset_stat_stages(self) -> None:
         """Reset all stat stages to 0."""
-        for stat in self.stat_stages:
-            self.stat_stages[stat] = 0
+        self.stat_stages.update(_ZERO_STAT_STAGES)
+        self._stat_cache.clear()
     
     def get_move(self, move_name: str) -> Optional[Move]:
         """Get a move by name.
@@ -223,10 +324,7 @@ class Pokemon:
         Returns:
             Optional[Move]: The move if found, None otherwise
         """
-        for move in self.moves:
-            if move.name.lower() == move_name.lower():
-                return move
-        return None
+        return self._moves_by_name().get(move_name.lower())
     
     def has_move(self, move_name: str) -> bool:
         """Check if the Pokémon has a specific move.
@@ -237,7 +335,35 @@ class Pokemon:
         Returns:
             bool: True if the Pokémon has the move, False otherwise
         """
-        return any(move.name.lower() == move_name.lower() for move in self.moves)
+        return move_name.lower() in self._moves_by_name()
+    
+    def add_move(self, move: Move) -> None:
+        """Teach the Pokémon a move.
+        
+        Args:
+            move (Move): The move to add
+        """
+        index = self._moves_by_name()
+        self.moves.append(move)
+        index.setdefault(move.name.lower(), move)
+        self._move_index_source = (self.moves, len(self.moves))
+    
+    def _moves_by_name(self) -> Dict[str, Move]:
+        """Get the Pokémon's moves keyed by lowercase name.
+        
+        The index is rebuilt whenever `moves` has been replaced or resized
+        since it was last built.
+        
+        Returns:
+            Dict[str, Move]: The first move with each name
+        """
+        source, size = self._move_index_source
+        if source is not self.moves or size != len(self.moves):
+            self._move_index = {}
+            for move in self.moves:
+                self._move_index.setdefault(move.name.lower(), move)
+            self._move_index_source = (self.moves, len(self.moves))
+        return self._move_index
     
     def __str__(self) -> str:
         """Return a string representation of the Pokémon."""
@@ -245,7 +371,7 @@ class Pokemon:
         if self.secondary_type:
             types += f"/{self.secondary_type}"
             
-        status = f" ({self.status.value})" if self.status and self.status != StatusCondition.NONE else ""
+        status = f" ({self.status.name.lower()})" if self.status and self.status != StatusCondition.NONE else ""
         
         return (
             f"{self.name} ({types}) Lv.{self.level}\n"
@@ -263,18 +389,4 @@ class Pokemon:
         Returns:
             str: The HP bar as a string
         """
-        if self.max_hp <= 0:
-            return "[DEAD]"
-            
-        hp_percent = self.current_hp / self.max_hp
-        filled = int(hp_percent * width)
-        bar = '█' * filled + ' ' * (width - filled)
-        
-        if hp_percent > 0.5:
-            color = "\033[92m"  # Green
-        elif hp_percent > 0.2:
-            color = "\033[93m"  # Yellow
-        else:
-            color = "\033[91m"  # Red
-            
-        return f"[{color}{bar}\033[0m] {self.current_hp}/{self.max_hp} ({hp_percent:.1%})"
+        return _render_hp_bar(self.current_hp, self.max_hp, width)
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from .pokemon import Pokemon
 
-@dataclass
+@dataclass(slots=True)
 class Trainer:
     """Represents a Pokémon trainer.
     
@@ -13,18 +13,32 @@ class Trainer:
         current_pokemon (Optional[Pokemon]): Currently active Pokémon
         items (Dict[str, int]): Items the trainer has
         battle_stats (Dict[str, Any]): Battle statistics
+        sprite_manager (optional): GUI SpriteManager; when given, party members'
+            sprites are prefetched in the background as they join the party
     """
     name: str
     party: List[Pokemon] = field(default_factory=list)
     current_pokemon: Optional[Pokemon] = None
     items: Dict[str, int] = field(default_factory=dict)
     battle_stats: Dict[str, Any] = field(default_factory=dict)
+    sprite_manager: Optional[Any] = field(default=None, repr=False, compare=False)
+    _alive_count: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize the trainer's current Pokémon."""
+        for pokemon in self.party:
+            self._register(pokemon)
+        if self.sprite_manager is not None and self.party:
+            self.sprite_manager.prefetch_async([pokemon.name for pokemon in self.party])
         if self.party and self.current_pokemon is None:
             self.current_pokemon = self.party[0]
     
+    def _register(self, pokemon: Pokemon) -> None:
+        """Link a party member to this trainer and count it if it's standing."""
+        pokemon._trainer = self
+        if pokemon.current_hp > 0:
+            self._alive_count += 1
+    
     def switch_pokemon(self, index: int) -> bool:
         """
         Switch to a different Pokémon.
@@ -45,10 +59,28 @@ class Trainer:
         """
         Check if the trainer has any usable Pokémon left.
         
+        Uses the live count kept by Pokemon.take_damage and Pokemon.heal, so
+        HP changes need to go through those for it to stay accurate.
+        
         Returns:
             bool: True if there's at least one non-fainted Pokémon
         """
-        return any(pokemon.current_hp > 0 for pokemon in self.party)
+        return self._alive_count > 0
+    
+    def get_stats(self, stat_name: str) -> List[int]:
+        """
+        Get the current value of a stat for every Pokémon in the party.
+        
+        Values come from each Pokémon's memoized get_stat, so querying the
+        whole party (e.g. to rank it by speed) doesn't redo the stat formula.
+        
+        Args:
+            stat_name: Name of the stat ('hp', 'attack', 'speed', etc.)
+            
+        Returns:
+            List[int]: The stat for each Pokémon, in party order
+        """
+        return [pokemon.get_stat(stat_name) for pokemon in self.party]
     
     def get_available_pokemon(self) -> List[Pokemon]:
         """
@@ -71,6 +103,9 @@ class Trainer:
         """
         if len(self.party) < 6:  # Maximum party size is 6
             self.party.append(pokemon)
+            self._register(pokemon)
+            if self.sprite_manager is not None:
+                self.sprite_manager.prefetch_async([pokemon.name])
             if self.current_pokemon is None:
                 self.current_pokemon = pokemon
     
@@ -86,6 +121,9 @@ class Trainer:
         """
         if pokemon in self.party:
             self.party.remove(pokemon)
+            pokemon._trainer = None
+            if pokemon.current_hp > 0:
+                self._alive_count -= 1
             if self.current_pokemon == pokemon:
                 self.current_pokemon = self.party[0] if self.party else None
             return True
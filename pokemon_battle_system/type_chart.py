@@ -0,0 +1,85 @@
+"""Type effectiveness chart for Pokémon battle system."""
+from types import MappingProxyType
+from typing import Optional
+from .enums import Type
+
+# Attacking type -> {defending type: multiplier}; pairs not listed are neutral.
+# This is a simplified type chart - in a real implementation, you'd want a complete one
+_TYPE_EFFECTIVENESS = {
+    'normal': {'rock': 0.5, 'ghost': 0, 'steel': 0.5},
+    'fire': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 2, 'bug': 2, 'rock': 0.5, 'dragon': 0.5, 'steel': 2},
+    'water': {'fire': 2, 'water': 0.5, 'grass': 0.5, 'ground': 2, 'rock': 2, 'dragon': 0.5},
+    'electric': {'water': 2, 'electric': 0.5, 'grass': 0.5, 'ground': 0, 'flying': 2, 'dragon': 0.5},
+    'grass': {'fire': 0.5, 'water': 2, 'grass': 0.5, 'poison': 0.5, 'ground': 2, 'flying': 0.5, 'bug': 0.5, 'rock': 2, 'dragon': 0.5, 'steel': 0.5},
+    'ice': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 0.5, 'ground': 2, 'flying': 2, 'dragon': 2, 'steel': 0.5},
+    'fighting': {'normal': 2, 'ice': 2, 'poison': 0.5, 'flying': 0.5, 'psychic': 0.5, 'bug': 0.5, 'rock': 2, 'ghost': 0, 'dark': 2, 'steel': 2, 'fairy': 0.5},
+    'poison': {'grass': 2, 'poison': 0.5, 'ground': 0.5, 'rock': 0.5, 'ghost': 0.5, 'steel': 0, 'fairy': 2},
+    'ground': {'fire': 2, 'electric': 2, 'grass': 0.5, 'poison': 2, 'flying': 0, 'bug': 0.5, 'rock': 2, 'steel': 2},
+    'flying': {'electric': 0.5, 'grass': 2, 'fighting': 2, 'bug': 2, 'rock': 0.5, 'steel': 0.5},
+    'psychic': {'fighting': 2, 'poison': 2, 'psychic': 0.5, 'dark': 0, 'steel': 0.5},
+    'bug': {'fire': 0.5, 'grass': 2, 'fighting': 0.5, 'poison': 0.5, 'flying': 0.5, 'psychic': 2, 'ghost': 0.5, 'dark': 2, 'steel': 0.5, 'fairy': 0.5},
+    'rock': {'fire': 2, 'ice': 2, 'fighting': 0.5, 'ground': 0.5, 'flying': 2, 'bug': 2, 'steel': 0.5},
+    'ghost': {'normal': 0, 'psychic': 2, 'ghost': 2, 'dark': 0.5},
+    'dragon': {'dragon': 2, 'steel': 0.5, 'fairy': 0},
+    'dark': {'fighting': 0.5, 'psychic': 2, 'ghost': 2, 'dark': 0.5, 'fairy': 0.5},
+    'steel': {'fire': 0.5, 'water': 0.5, 'electric': 0.5, 'ice': 2, 'rock': 2, 'steel': 0.5, 'fairy': 2},
+    'fairy': {'fire': 0.5, 'fighting': 2, 'poison': 0.5, 'dragon': 2, 'dark': 2, 'steel': 0.5}
+}
+
+# Read-only view of the chart above, for lookups by type name
+TYPE_EFFECTIVENESS = MappingProxyType({
+    attacker: MappingProxyType(row) for attacker, row in _TYPE_EFFECTIVENESS.items()
+})
+
+# TYPE_CHART[attacking type id][defending type id] -> multiplier, built once at import
+TYPE_CHART = tuple(
+    tuple(
+        float(TYPE_EFFECTIVENESS.get(attacker.name.lower(), {}).get(defender.name.lower(), 1.0))
+        for defender in Type
+    )
+    for attacker in Type
+)
+
+def type_id(type_name: Optional[str]) -> int:
+    """Get the chart index of a type.
+    
+    Args:
+        type_name (str, optional): Name of the type (case-insensitive)
+        
+    Returns:
+        int: The Type value, or -1 if the name is empty or not a known type
+    """
+    if not type_name:
+        return -1
+    member = Type.__members__.get(type_name.upper())
+    return -1 if member is None else int(member)
+
+def type_bit(type_id: int) -> int:
+    """Get the bitmask bit of a type chart index.
+    
+    Args:
+        type_id (int): Chart index of the type (-1 if unknown)
+        
+    Returns:
+        int: ``1 << type_id``, or 0 for an unknown type
+    """
+    return 1 << type_id if type_id >= 0 else 0
+
+def type_effectiveness(move_type_id: int, primary_type_id: int, secondary_type_id: int = -1) -> float:
+    """Look up the effectiveness of a move type against a defender's types.
+    
+    Args:
+        move_type_id (int): Chart index of the move's type (-1 if unknown)
+        primary_type_id (int): Chart index of the defender's primary type (-1 if unknown)
+        secondary_type_id (int): Chart index of the defender's secondary type (-1 if none)
+        
+    Returns:
+        float: Effectiveness multiplier (0, 0.25, 0.5, 1, 2, or 4)
+    """
+    if move_type_id < 0:
+        return 1.0
+    row = TYPE_CHART[move_type_id]
+    effectiveness = row[primary_type_id] if primary_type_id >= 0 else 1.0
+    if secondary_type_id >= 0:
+        effectiveness *= row[secondary_type_id]
+    return effectiveness